@@ -0,0 +1,194 @@
+"""Scale benchmarks for the history and reporting paths on synthetic data.
+
+Each benchmark runs once for wall time and once under tracemalloc for peak
+memory, at every requested history size. Results are appended to a JSON-lines
+file tagged with the git revision, and compared with the previous result for
+the same benchmark and scale so regressions show up across versions:
+
+    python src/cli.py bench --scales 100k,1m --candidates 2000
+    python src/cli.py bench --scales 10m --benchmarks get_applied_jobs,generate_report
+"""
+
+import contextlib
+import io
+import json
+import logging
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from synthetic_data import candidate_email, generate_dataset
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_RESULTS = 'logs/bench_results.jsonl'
+SCALE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_scale(value):
+    value = str(value).strip().lower().replace('_', '')
+    multiplier = SCALE_SUFFIXES.get(value[-1:], 1)
+    return int(float(value.rstrip('km')) * multiplier)
+
+
+class BenchContext:
+    """A throwaway project tree (config + synthetic data) and the objects under test, built before timing starts."""
+
+    def __init__(self, base_dir):
+        from dashboard import JobBotDashboard
+        from jobbot_multi import InsightGlobalJobBot
+        self.base_dir = Path(base_dir)
+        self.applied_jobs_csv = self.base_dir / 'data' / 'applied_jobs.csv'
+        self.busiest_candidate = candidate_email(0)  # rank 0 has the most history under the Zipf skew
+        self.bot = InsightGlobalJobBot(base_dir=self.base_dir)
+        logging.getLogger().setLevel(logging.WARNING)
+        self.dashboard = JobBotDashboard(self.base_dir)
+
+    def close(self):
+        if self.bot.negative_cache: self.bot.negative_cache.close()
+        if self.bot.events: self.bot.events.close()
+        root = logging.getLogger()
+        for handler in [h for h in root.handlers if isinstance(h, logging.FileHandler) and str(self.base_dir) in h.baseFilename]:
+            root.removeHandler(handler)
+            handler.close()
+
+
+def _generate_report(ctx):
+    from utils import generate_report
+    generate_report(str(ctx.applied_jobs_csv), str(ctx.base_dir / 'logs' / 'report.json'))
+
+
+def _history_load_legacy(ctx):
+    import pandas as pd
+    df = pd.read_csv(ctx.applied_jobs_csv)
+    df['AppliedDate'] = pd.to_datetime(df['AppliedDate'])
+
+
+def _history_load(ctx):
+    from history import load_history
+    load_history(ctx.applied_jobs_csv)
+
+
+def _history_load_candidate(ctx):
+    from history import load_history
+    load_history(ctx.applied_jobs_csv, candidate=ctx.busiest_candidate)
+
+
+BENCHMARKS = {
+    'get_applied_jobs': lambda ctx: ctx.bot.get_applied_jobs(ctx.busiest_candidate),
+    'save_applied_job': lambda ctx: ctx.bot.save_applied_job(ctx.busiest_candidate, 'Benchmark Engineer', 'bench-1'),
+    'view_statistics': lambda ctx: ctx.dashboard.view_statistics(),
+    'export_report': lambda ctx: ctx.dashboard.export_report(),
+    'generate_report': _generate_report,
+    'history_load_legacy': _history_load_legacy,
+    'history_load': _history_load,
+    'history_load_candidate': _history_load_candidate,
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=BASE_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def measure(fn, ctx):
+    """Return (wall seconds, peak traced MB, error text) for one call, with its console output swallowed."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        start = time.perf_counter()
+        fn(ctx)
+        wall = time.perf_counter() - start
+
+        tracemalloc.start()
+        try:
+            fn(ctx)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    # The functions under test report failures on stdout rather than raising
+    errors = [line.strip() for line in out.getvalue().splitlines() if line.strip().lower().startswith('error')]
+    return wall, peak / (1024 * 1024), errors[0] if errors else None
+
+
+def load_results(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_result(history, result):
+    for old in reversed(history):
+        if (old['benchmark'], old['rows'], old['candidates']) == (result['benchmark'], result['rows'], result['candidates']) \
+                and old.get('error') is None:
+            return old
+    return None
+
+
+def run_benchmarks(scales, candidates=2000, benchmarks=None, results_path=DEFAULT_RESULTS, label=None,
+                   tolerance=0.25, workdir=None, seed=0, keep=False):
+    """Run every benchmark at every scale; return (results, regressions)."""
+    names = benchmarks or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f'Unknown benchmarks: {", ".join(sorted(unknown))} (available: {", ".join(BENCHMARKS)})')
+
+    results_path = Path(results_path)
+    if not results_path.is_absolute():
+        results_path = BASE_DIR / results_path
+    history = load_results(results_path)
+    revision = git_revision()
+    run_at = datetime.now().isoformat(timespec='seconds')
+    results, regressions = [], []
+
+    for rows in scales:
+        base = Path(tempfile.mkdtemp(prefix=f'jobbot_bench_{rows}_', dir=workdir))
+        ctx = None
+        try:
+            (base / 'config').mkdir()
+            (base / 'logs').mkdir()
+            shutil.copy(BASE_DIR / 'config' / 'settings.ini', base / 'config' / 'settings.ini')
+            start = time.perf_counter()
+            generate_dataset(base, rows, candidates, seed=seed)
+            print(f'\n{rows:,} history rows, {candidates:,} candidates (generated in {time.perf_counter() - start:.1f}s)')
+            ctx = BenchContext(base)
+
+            for name in names:
+                wall, peak_mb, error = measure(BENCHMARKS[name], ctx)
+                result = {'run_at': run_at, 'revision': revision, 'label': label, 'benchmark': name, 'rows': rows,
+                          'candidates': candidates, 'wall_seconds': round(wall, 4), 'peak_mb': round(peak_mb, 2), 'error': error}
+                old = previous_result(history, result)
+                flags = []
+                if old and error is None:
+                    if wall > old['wall_seconds'] * (1 + tolerance) and wall - old['wall_seconds'] > 0.05:
+                        flags.append(f'wall {old["wall_seconds"]:.3f}s -> {wall:.3f}s')
+                    if peak_mb > old['peak_mb'] * (1 + tolerance) and peak_mb - old['peak_mb'] > 1:
+                        flags.append(f'peak {old["peak_mb"]:.1f} MB -> {peak_mb:.1f} MB')
+                if flags:
+                    regressions.append({**result, 'baseline_revision': old.get('revision'), 'changes': flags})
+                results.append(result)
+                print(f'  {name:<18} {wall:9.3f}s {peak_mb:10.1f} MB'
+                      + (f'  vs {old.get("revision") or old["run_at"]}: {wall / old["wall_seconds"]:.2f}x time' if old and error is None and old['wall_seconds'] else '')
+                      + (f'  REGRESSION ({"; ".join(flags)})' if flags else '')
+                      + (f'  {error}' if error else ''))
+        finally:
+            if ctx: ctx.close()
+            if keep:
+                print(f'  data kept in {base}')
+            else:
+                shutil.rmtree(base, ignore_errors=True)
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_path, 'a', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps(result) + '\n')
+    print(f'\nResults appended to {results_path}')
+    return results, regressions
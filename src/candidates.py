@@ -0,0 +1,37 @@
+import csv
+import zlib
+
+
+READ_BUFFER_BYTES = 1 << 16
+
+
+def parse_shard(value):
+    """Parse an ``i/n`` shard spec (0-based: 0/4 .. 3/4) into a (index, count) tuple."""
+    try:
+        index, count = (int(part) for part in str(value).split('/'))
+    except ValueError:
+        raise ValueError(f'Invalid shard {value!r}, expected i/n such as 0/4') from None
+    if count < 1:
+        raise ValueError(f'Invalid shard {value!r}, shard count must be at least 1')
+    if not 0 <= index < count:
+        raise ValueError(f'Invalid shard {value!r}, index must be in 0..{count - 1}')
+    return index, count
+
+
+def shard_of(email, count):
+    """Stable shard for a candidate: the same Email maps to the same shard on every host and run."""
+    return zlib.crc32(str(email).strip().lower().encode('utf-8')) % count
+
+
+def iter_candidates(path, shard=None, status='active'):
+    """Yield candidate rows one at a time, keeping only the given Status and shard.
+
+    Rows are plain dicts of strings, so memory stays flat whatever the roster size.
+    """
+    with open(path, newline='', encoding='utf-8-sig', buffering=READ_BUFFER_BYTES) as f:
+        for row in csv.DictReader(f):
+            if (row.get('Status') or '').strip().lower() != status:
+                continue
+            if shard and shard_of(row.get('Email', ''), shard[1]) != shard[0]:
+                continue
+            yield row
@@ -0,0 +1,273 @@
+"""Command line entry point for the job bot.
+
+Every subcommand imports its dependencies lazily so that light commands
+(template, report --summary) never pay for pandas or selenium.
+
+    python src/cli.py run [--shard I/N] [--record PATH]
+    python src/cli.py replay PATH [--max-commands N]
+    python src/cli.py dashboard
+    python src/cli.py report [--summary]
+    python src/cli.py template
+    python src/cli.py stats-server [--port 8765]
+    python src/cli.py setup
+    python src/cli.py check-startup
+    python src/cli.py synth --output-dir DIR --rows N
+    python src/cli.py bench [--scales 100k,1m,10m]
+    python src/cli.py events [--event applied] [--since 24h] [--count]
+
+Relative file paths are taken from the project root, like the bot's own, so
+the commands read and write the same files from any working directory.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ('pandas', 'numpy', 'selenium', 'webdriver_manager', 'dotenv', 'requests', 'openpyxl')
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def _project_path(value):
+    """argparse type: a relative path is resolved against the project root, not the working directory."""
+    path = Path(value)
+    return str(path if path.is_absolute() else BASE_DIR / path)
+
+
+def cmd_run(args):
+    from jobbot_multi import InsightGlobalJobBot
+    from settings import SettingsError
+    print('='*60)
+    print('Insight Global Job Application Bot')
+    print('Multi-Candidate Automation')
+    print('='*60)
+    print()
+    try:
+        bot = InsightGlobalJobBot(args.config, record_path=args.record, shard=args.shard)
+    except SettingsError as e:
+        print(f'Invalid settings: {e}')
+        return 1
+    bot.run()
+
+
+def cmd_replay(args):
+    import json
+    from replay import replay_recording
+    stats = replay_recording(args.recording, args.config)
+    print(json.dumps(stats, indent=2))
+    failed = bool(stats['divergences'])
+    if args.max_commands is not None and stats['commands_replayed'] > args.max_commands:
+        print(f'FAIL: {stats["commands_replayed"]} WebDriver commands exceeds budget of {args.max_commands}')
+        failed = True
+    if stats['divergences']:
+        print(f'FAIL: control flow diverged from the recording ({len(stats["divergences"])} divergences)')
+    return 1 if failed else 0
+
+
+def cmd_dashboard(args):
+    from dashboard import JobBotDashboard
+    JobBotDashboard().run()
+
+
+def cmd_report(args):
+    if args.summary:
+        from utils import summarize_applications
+        summarize_applications(args.input)
+    else:
+        from utils import generate_report
+        generate_report(args.input, args.output)
+
+
+def cmd_stats_server(args):
+    from stats_service import serve
+    serve(args.input, args.host, args.port, args.interval)
+
+
+def cmd_template(args):
+    from utils import create_candidates_template
+    create_candidates_template(args.output)
+
+
+def cmd_setup(args):
+    import runpy
+    runpy.run_path(str(BASE_DIR / 'setup_api.py'), run_name='__main__')
+
+
+def _import_profile(argv):
+    """Run the CLI in a child interpreter with -X importtime; return (wall seconds, import seconds, modules)."""
+    import subprocess
+    import time
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', __file__, *argv],
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f'{" ".join(argv)} exited with {proc.returncode}: {proc.stderr.strip()[-500:]}')
+
+    import_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.add(name.strip())
+        if not name[1:].startswith(' '):  # top-level imports only, nested ones are included in cumulative
+            import_us += int(cumulative)
+    return wall, import_us / 1e6, modules
+
+
+def cmd_check_startup(args):
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        commands = [
+            ['template', '--output', str(Path(tmp) / 'candidates_template.csv')],
+            ['report', '--summary', '--input', args.input],
+            ['events', '--count', '--file', args.events],
+            ['--help'],
+        ]
+        failed = False
+        for argv in commands:
+            wall, imports, modules = _import_profile(argv)
+            heavy = sorted(m for m in modules if m.split('.')[0] in HEAVY_MODULES)
+            ok = imports <= args.budget and not heavy
+            failed |= not ok
+            print(f'{"OK  " if ok else "FAIL"} {" ".join(argv[:2]):<20} imports {imports*1000:6.1f} ms  wall {wall*1000:6.1f} ms'
+                  + (f'  heavy: {", ".join(heavy)}' if heavy else ''))
+    print(f'Startup budget: {args.budget*1000:.0f} ms of imports per command')
+    return 1 if failed else 0
+
+
+def cmd_synth(args):
+    from synthetic_data import generate_dataset
+    data_dir = generate_dataset(args.output_dir, args.rows, args.candidates, args.jobs, args.days, args.seed)
+    print(f'Wrote {args.rows:,} history rows and {args.candidates:,} candidates to {data_dir}')
+
+
+def cmd_bench(args):
+    from bench import parse_scale, run_benchmarks
+    scales = [parse_scale(s) for s in args.scales.split(',') if s.strip()]
+    benchmarks = [b.strip() for b in args.benchmarks.split(',')] if args.benchmarks else None
+    _, regressions = run_benchmarks(scales, args.candidates, benchmarks, args.results, args.label,
+                                    args.tolerance, args.workdir, args.seed, args.keep)
+    if regressions:
+        print(f'{len(regressions)} regression(s) beyond {args.tolerance:.0%} of the previous result')
+    return 1 if regressions and args.check else 0
+
+
+def cmd_events(args):
+    import json
+    from collections import Counter
+    from event_log import iter_events
+    events = [e.strip() for e in args.event.split(',') if e.strip()] if args.event else None
+    try:
+        matches = iter_events(args.file, events, args.candidate, args.job_id, args.run, args.since, args.until)
+    except ValueError as e:
+        print(f'Invalid time: {e}', file=sys.stderr)
+        return 2
+    if args.count:
+        counts = Counter(event['event'] for event in matches)
+        for name, count in counts.most_common():
+            print(f'{name:<16} {count}')
+        return 0
+    for idx, event in enumerate(matches, 1):
+        print(json.dumps(event, ensure_ascii=False))
+        if args.limit and idx >= args.limit:
+            break
+    return 0
+
+
+def _shard(value):
+    from candidates import parse_shard
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='jobbot', description='Insight Global job application bot')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='Apply to jobs for every active candidate')
+    run.add_argument('--config', default='config/settings.ini', help='Settings file relative to the project root')
+    run.add_argument('--shard', type=_shard, metavar='I/N', help='Only process candidates whose Email hashes to shard I of N (0-based)')
+    run.add_argument('--record', metavar='PATH', help='Record WebDriver commands and DOM snapshots to a JSON-lines file')
+    run.set_defaults(func=cmd_run)
+
+    replay = sub.add_parser('replay', help='Replay a recorded session offline and report round-trips')
+    replay.add_argument('recording')
+    replay.add_argument('--config', default='config/settings.ini')
+    replay.add_argument('--max-commands', type=int, help='Fail if more WebDriver commands than this are issued')
+    replay.set_defaults(func=cmd_replay)
+
+    sub.add_parser('dashboard', help='Interactive statistics dashboard').set_defaults(func=cmd_dashboard)
+
+    report = sub.add_parser('report', help='Application report')
+    report.add_argument('--summary', action='store_true', help='Print totals only (fast, no pandas)')
+    report.add_argument('--input', type=_project_path, default='data/applied_jobs.csv')
+    report.add_argument('--output', type=_project_path, default='logs/report.json')
+    report.set_defaults(func=cmd_report)
+
+    stats = sub.add_parser('stats-server', help='Serve live application stats as JSON over local HTTP')
+    stats.add_argument('--input', type=_project_path, default='data/applied_jobs.csv')
+    stats.add_argument('--host', default='127.0.0.1')
+    stats.add_argument('--port', type=int, default=8765)
+    stats.add_argument('--interval', type=float, default=2.0, help='Seconds between checks for new history rows')
+    stats.set_defaults(func=cmd_stats_server)
+
+    template = sub.add_parser('template', help='Write a sample candidates CSV')
+    template.add_argument('--output', type=_project_path, default='data/candidates_template.csv')
+    template.set_defaults(func=cmd_template)
+
+    sub.add_parser('setup', help='Configure WBL API credentials').set_defaults(func=cmd_setup)
+
+    check = sub.add_parser('check-startup', help='Verify light commands stay within the import-time budget')
+    check.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS, help='Seconds of imports allowed per command')
+    check.add_argument('--input', type=_project_path, default='data/applied_jobs.csv')
+    check.add_argument('--events', type=_project_path, default='logs/events.jsonl')
+    check.set_defaults(func=cmd_check_startup)
+
+    synth = sub.add_parser('synth', help='Generate synthetic candidates.csv and applied_jobs.csv for scale testing')
+    synth.add_argument('--output-dir', required=True, help='Project-like directory; files are written to its data/ folder')
+    synth.add_argument('--rows', type=int, default=100_000, help='applied_jobs.csv history rows')
+    synth.add_argument('--candidates', type=int, default=2000)
+    synth.add_argument('--jobs', type=int, help='Distinct job postings (default: rows / 20)')
+    synth.add_argument('--days', type=int, default=365, help='Days of history to spread the rows over')
+    synth.add_argument('--seed', type=int, default=0)
+    synth.set_defaults(func=cmd_synth)
+
+    bench = sub.add_parser('bench', help='Benchmark history/reporting functions on synthetic data at several scales')
+    bench.add_argument('--scales', default='100k,1m', help='Comma-separated history sizes, e.g. 100k,1m,10m')
+    bench.add_argument('--candidates', type=int, default=2000)
+    bench.add_argument('--benchmarks', help='Comma-separated subset (default: all)')
+    bench.add_argument('--results', default='logs/bench_results.jsonl', help='JSON-lines file results are appended to')
+    bench.add_argument('--label', help='Free-form tag stored with the results')
+    bench.add_argument('--tolerance', type=float, default=0.25, help='Relative slowdown or memory growth flagged as a regression')
+    bench.add_argument('--check', action='store_true', help='Exit non-zero when a regression is found')
+    bench.add_argument('--workdir', help='Where to generate the temporary datasets (default: system temp)')
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument('--keep', action='store_true', help='Keep the generated datasets')
+    bench.set_defaults(func=cmd_bench)
+
+    events = sub.add_parser('events', help='Query the JSON-lines run events, including rotated .gz files')
+    events.add_argument('--file', type=_project_path, default='logs/events.jsonl', help='Live event file; rotated and per-shard files next to it are included')
+    events.add_argument('--event', help='Comma-separated event names, e.g. applied,form_error')
+    events.add_argument('--candidate', help='Candidate email')
+    events.add_argument('--job-id')
+    events.add_argument('--run', help='run_id, e.g. 20250101_120000')
+    events.add_argument('--since', help='ISO time or age such as 30m, 12h, 7d')
+    events.add_argument('--until', help='ISO time or age such as 30m, 12h, 7d')
+    events.add_argument('--count', action='store_true', help='Print counts per event instead of the events')
+    events.add_argument('--limit', type=int, help='Stop after this many events')
+    events.set_defaults(func=cmd_events)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
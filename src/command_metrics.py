@@ -0,0 +1,160 @@
+import bisect
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from selenium.webdriver.remote.command import Command
+
+from utils import find_call_site
+
+
+# Upper bounds of the latency histogram buckets, in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+FIND_COMMANDS = {Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS}
+# A find that fails after this fraction of the implicit wait spent the whole wait polling
+IMPLICIT_WAIT_RATIO = 0.9
+
+
+def _bucket_label(i):
+    return f'<={LATENCY_BUCKETS_MS[i]}ms' if i < len(LATENCY_BUCKETS_MS) else f'>{LATENCY_BUCKETS_MS[-1]}ms'
+
+
+class _Stat:
+    __slots__ = ('count', 'errors', 'implicit_wait_timeouts', 'implicit_wait_seconds', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = self.errors = self.implicit_wait_timeouts = 0
+        self.implicit_wait_seconds = self.total = self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed, error, implicit_timeout):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed * 1000)] += 1
+        self.errors += bool(error)
+        if implicit_timeout:
+            self.implicit_wait_timeouts += 1
+            self.implicit_wait_seconds += elapsed
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile, in ms."""
+        target, seen = q * self.count, 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else round(self.max * 1000)
+        return 0
+
+    def as_dict(self):
+        return {'count': self.count, 'errors': self.errors, 'total_seconds': round(self.total, 3),
+                'mean_ms': round(self.total / self.count * 1000, 1) if self.count else 0.0,
+                'p50_ms': self.percentile(0.5), 'p95_ms': self.percentile(0.95), 'max_ms': round(self.max * 1000, 1),
+                'implicit_wait_timeouts': self.implicit_wait_timeouts,
+                'implicit_wait_seconds': round(self.implicit_wait_seconds, 3),
+                'histogram': {_bucket_label(i): n for i, n in enumerate(self.buckets) if n}}
+
+
+class CommandMetrics:
+    """Counts every WebDriver command by type and bot call site, with latency histograms.
+
+    The implicit wait is tracked from the session's own setTimeouts commands, so a
+    find that fails only after polling for the full implicit wait is flagged as
+    an implicit-wait timeout.
+    """
+
+    def __init__(self, implicit_wait=0.0):
+        self.logger = logging.getLogger(__name__)
+        self.implicit_wait = implicit_wait
+        self.started = time.time()
+        self._stats = defaultdict(_Stat)  # (command, site) -> _Stat
+        self._lock = threading.Lock()
+
+    def wrap(self, executor):
+        return MetricsExecutor(executor, self)
+
+    def record(self, command, params, response, elapsed, error, site):
+        if command == Command.SET_TIMEOUTS and 'implicit' in (params or {}):
+            self.implicit_wait = params['implicit'] / 1000
+        value = response.get('value') if isinstance(response, dict) else None
+        failed = error is not None or (isinstance(value, dict) and 'error' in value)
+        implicit_timeout = (command in FIND_COMMANDS and self.implicit_wait > 0
+                            and elapsed >= self.implicit_wait * IMPLICIT_WAIT_RATIO and (failed or value == []))
+        with self._lock:
+            self._stats[command, site].add(elapsed, failed, implicit_timeout)
+
+    def _rollup(self, key):
+        rolled = defaultdict(_Stat)
+        for (command, site), stat in self._stats.items():
+            target = rolled[(command, site)[key]]
+            target.count += stat.count
+            target.errors += stat.errors
+            target.total += stat.total
+            target.max = max(target.max, stat.max)
+            target.implicit_wait_timeouts += stat.implicit_wait_timeouts
+            target.implicit_wait_seconds += stat.implicit_wait_seconds
+            target.buckets = [a + b for a, b in zip(target.buckets, stat.buckets)]
+        return rolled
+
+    def report(self, top=10):
+        with self._lock:
+            by_command, by_site = self._rollup(0), self._rollup(1)
+            pairs = sorted(self._stats.items(), key=lambda item: item[1].total, reverse=True)
+            total = sum(stat.total for stat in self._stats.values())
+            implicit = sum(stat.implicit_wait_seconds for stat in self._stats.values())
+            return {
+                'run_seconds': round(time.time() - self.started, 1),
+                'commands': sum(stat.count for stat in self._stats.values()),
+                'command_seconds': round(total, 3),
+                'implicit_wait_timeouts': sum(stat.implicit_wait_timeouts for stat in self._stats.values()),
+                'implicit_wait_seconds': round(implicit, 3),
+                'worst_offenders': [{'command': command, 'site': site, **stat.as_dict()} for (command, site), stat in pairs[:top]],
+                'implicit_wait_offenders': [{'command': command, 'site': site, 'timeouts': stat.implicit_wait_timeouts,
+                                             'seconds': round(stat.implicit_wait_seconds, 3)}
+                                            for (command, site), stat in sorted(self._stats.items(), key=lambda item: item[1].implicit_wait_seconds, reverse=True)
+                                            if stat.implicit_wait_timeouts][:top],
+                'by_command': {name: stat.as_dict() for name, stat in sorted(by_command.items(), key=lambda item: item[1].total, reverse=True)},
+                'by_site': {name: stat.as_dict() for name, stat in sorted(by_site.items(), key=lambda item: item[1].total, reverse=True)},
+            }
+
+    def write_report(self, path, top=10):
+        report = self.report(top)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def log_summary(self, report, top=5):
+        self.logger.info(f'  WebDriver commands: {report["commands"]} taking {report["command_seconds"]:.1f}s '
+                         f'of {report["run_seconds"]:.0f}s; implicit-wait timeouts: {report["implicit_wait_timeouts"]} '
+                         f'({report["implicit_wait_seconds"]:.1f}s)')
+        for entry in report['worst_offenders'][:top]:
+            self.logger.info(f'    {entry["site"]}/{entry["command"]}: {entry["count"]}x, {entry["total_seconds"]:.1f}s total, '
+                             f'p95 {entry["p95_ms"]}ms, {entry["implicit_wait_timeouts"]} implicit-wait timeouts')
+
+
+class MetricsExecutor:
+    """Command-executor proxy that times each command into a CommandMetrics."""
+
+    def __init__(self, executor, metrics):
+        self._executor = executor
+        self.metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        response = error = None
+        try:
+            response = self._executor.execute(command, params)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.metrics.record(command, params, response, time.perf_counter() - start, error, find_call_site())
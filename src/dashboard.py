@@ -5,16 +5,19 @@ from datetime import datetime
 import shutil
 
 
-try:
-    import pandas as pd
-except ImportError:
-    print('Error: pandas not installed. Run: pip install pandas')
-    sys.exit(1)
+def _pandas():
+    # Imported on first use so the menu (and the CLI) start without pandas
+    try:
+        import pandas as pd
+    except ImportError:
+        print('Error: pandas not installed. Run: pip install pandas')
+        sys.exit(1)
+    return pd
 
 
 class JobBotDashboard:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, base_dir=None):
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
         self.candidates_file = self.base_dir / 'data' / 'candidates.csv'
         self.applied_jobs_file = self.base_dir / 'data' / 'applied_jobs.csv'
     
@@ -33,6 +36,7 @@ class JobBotDashboard:
     
     def view_candidates(self):
         try:
+            pd = _pandas()
             if not self.candidates_file.exists():
                 print('No candidates file found!')
                 return
@@ -51,11 +55,13 @@ class JobBotDashboard:
     
     def view_statistics(self):
         try:
+            _pandas()
+            from history import load_history
             if not self.applied_jobs_file.exists():
                 print('\nNo applications yet!')
                 return
             
-            df = pd.read_csv(self.applied_jobs_file)
+            df = load_history(self.applied_jobs_file, columns=['CandidateEmail', 'AppliedDate', 'Status'])
             
             print('\n' + '='*60)
             print('Application Statistics')
@@ -64,19 +70,17 @@ class JobBotDashboard:
             print(f'\nðŸ“Š Total Applications: {len(df)}')
             
             print('\nðŸ“§ By Candidate:')
-            by_candidate = df.groupby('CandidateEmail').size().sort_values(ascending=False)
+            by_candidate = df.groupby('CandidateEmail', observed=True).size().sort_values(ascending=False)
             for email, count in by_candidate.items():
                 print(f'  â€¢ {email}: {count}')
             
             print('\nðŸ“ˆ By Status:')
-            by_status = df.groupby('Status').size()
+            by_status = df.groupby('Status', observed=True).size()
             for status, count in by_status.items():
                 print(f'  â€¢ {status}: {count}')
             
             print('\nðŸ“… By Date:')
-            df['AppliedDate'] = pd.to_datetime(df['AppliedDate'])
-            df['Date'] = df['AppliedDate'].dt.date
-            by_date = df.groupby('Date').size().tail(7)
+            by_date = df.groupby(df['AppliedDate'].dt.date).size().tail(7)
             for date, count in by_date.items():
                 print(f'  â€¢ {date}: {count}')
             
@@ -85,11 +89,13 @@ class JobBotDashboard:
     
     def view_recent_applications(self):
         try:
+            _pandas()
+            from history import load_history
             if not self.applied_jobs_file.exists():
                 print('\nNo applications yet!')
                 return
             
-            df = pd.read_csv(self.applied_jobs_file)
+            df = load_history(self.applied_jobs_file, columns=['CandidateEmail', 'JobTitle', 'AppliedDate', 'Status'])
             
             print('\n' + '='*60)
             print('Recent Applications (Last 20)')
@@ -104,21 +110,21 @@ class JobBotDashboard:
     
     def view_applications_by_candidate(self):
         try:
+            _pandas()
+            from history import load_history
             if not self.applied_jobs_file.exists():
                 print('\nNo applications yet!')
                 return
             
-            df = pd.read_csv(self.applied_jobs_file)
-            
-            candidates = df['CandidateEmail'].unique()
+            counts = load_history(self.applied_jobs_file, columns=['CandidateEmail'])['CandidateEmail'].value_counts(sort=False)
+            candidates = counts[counts > 0].index
             
             print('\n' + '='*60)
             print('Select Candidate:')
             print('='*60)
             
             for idx, email in enumerate(candidates, 1):
-                count = len(df[df['CandidateEmail'] == email])
-                print(f'{idx}. {email} ({count} applications)')
+                print(f'{idx}. {email} ({counts[email]} applications)')
             
             print('0. Back')
             
@@ -128,7 +134,7 @@ class JobBotDashboard:
                     return
                 if 1 <= choice <= len(candidates):
                     selected_email = candidates[choice - 1]
-                    candidate_apps = df[df['CandidateEmail'] == selected_email]
+                    candidate_apps = load_history(self.applied_jobs_file, candidate=selected_email)
                     
                     print(f'\n' + '='*60)
                     print(f'Applications for {selected_email}')
@@ -145,11 +151,13 @@ class JobBotDashboard:
     
     def export_report(self):
         try:
+            pd = _pandas()
+            from history import load_history
             if not self.applied_jobs_file.exists():
                 print('\nNo applications yet!')
                 return
             
-            df = pd.read_csv(self.applied_jobs_file)
+            df = load_history(self.applied_jobs_file)
             report_dir = self.base_dir / 'reports'
             report_dir.mkdir(exist_ok=True)
             
@@ -158,13 +166,13 @@ class JobBotDashboard:
             
             with pd.ExcelWriter(report_file, engine='openpyxl') as writer:
                 df.to_excel(writer, sheet_name='All Applications', index=False)
-                by_candidate = df.groupby('CandidateEmail').agg({
+                by_candidate = df.groupby('CandidateEmail', observed=True).agg({
                     'JobTitle': 'count',
                     'AppliedDate': ['min', 'max']
                 }).reset_index()
                 by_candidate.columns = ['Email', 'Total Applications', 'First Application', 'Last Application']
                 by_candidate.to_excel(writer, sheet_name='By Candidate', index=False)
-                by_status = df.groupby('Status').size().reset_index(name='Count')
+                by_status = df.groupby('Status', observed=True).size().reset_index(name='Count')
                 by_status.to_excel(writer, sheet_name='By Status', index=False)
             
             print(f'\nâœ… Report exported to: {report_file}')
@@ -178,6 +186,7 @@ class JobBotDashboard:
         
         if confirm == 'DELETE':
             try:
+                pd = _pandas()
                 if self.applied_jobs_file.exists():
                     backup_dir = self.base_dir / 'backups'
                     backup_dir.mkdir(exist_ok=True)
@@ -0,0 +1,190 @@
+"""Structured run events as JSON lines.
+
+Events (``login_ok``, ``search_done``, ``job_skipped``, ``applied``,
+``form_error``, ...) go through a QueueHandler, so the bot never waits on disk;
+a QueueListener thread writes them to ``logs/events.jsonl``. The file rotates
+by size and rotated files are gzipped in the background, keeping at most
+``backup_count`` of them. ``iter_events`` streams the live and rotated files
+back, filtered, one line at a time:
+
+    python src/cli.py events --event applied,form_error --since 24h
+    python src/cli.py events --candidate jane@example.com --count
+"""
+
+import atexit
+import gzip
+import heapq
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+
+EVENTS_LOGGER = 'jobbot.events'
+RELATIVE_TIME = re.compile(r'^(\d+(?:\.\d+)?)([smhd])$')
+TIME_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+class JsonEventFormatter(logging.Formatter):
+    """One compact JSON object per event: ts, event, then the event's fields (None values dropped)."""
+
+    def format(self, record):
+        event = {'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'), 'event': record.getMessage()}
+        event.update((k, v) for k, v in getattr(record, 'fields', {}).items() if v is not None)
+        return json.dumps(event, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler whose backups are gzipped by a background thread (events.jsonl.1.gz, ...)."""
+
+    def __init__(self, filename, max_bytes, backup_count):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        self.namer = lambda name: name + '.gz'
+        self.rotator = self._rotate
+        self._compressing = None
+
+    def _rotate(self, source, dest):
+        # Only the rename happens on the writer thread; dest[:-3] stays readable (uncompressed) until gzip finishes
+        pending = dest[:-3]
+        os.replace(source, pending)
+        self._compressing = threading.Thread(target=self._compress, args=(pending, dest), name='events-gzip', daemon=True)
+        self._compressing.start()
+
+    @staticmethod
+    def _compress(source, dest):
+        try:
+            with open(source, 'rb') as src, gzip.open(dest + '.tmp', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(dest + '.tmp', dest)
+            os.remove(source)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f'Could not compress {source}: {e}')
+
+    def wait(self):
+        if self._compressing:
+            self._compressing.join()
+
+    def doRollover(self):
+        # The previous backup must be compressed before the backups are shifted
+        self.wait()
+        super().doRollover()
+
+    def close(self):
+        super().close()
+        self.wait()
+
+
+class EventLog:
+    """Non-blocking writer for run events; ``context`` fields (run_id, shard) are added to every event."""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=5, **context):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.context = {k: v for k, v in context.items() if v is not None}
+        self.handler = CompressingRotatingFileHandler(self.path, max_bytes, backup_count)
+        self.handler.setFormatter(JsonEventFormatter())
+        self._queue_handler = QueueHandler(queue.SimpleQueue())
+        self.listener = QueueListener(self._queue_handler.queue, self.handler)
+        self.logger = logging.getLogger(EVENTS_LOGGER)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self._queue_handler)
+        self.listener.start()
+        self._closed = False
+        atexit.register(self.close)  # the listener thread is a daemon: flush what is queued on any exit
+
+    def emit(self, event, candidate=None, job_id=None, duration=None, **fields):
+        fields = {**self.context, 'candidate': candidate, 'job_id': job_id,
+                  'duration': round(duration, 3) if duration is not None else None, **fields}
+        self.logger.info(event, extra={'fields': fields})
+
+    def close(self):
+        """Flush queued events and wait for any background compression."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.logger.removeHandler(self._queue_handler)
+        self.listener.stop()
+        self.handler.close()
+
+
+def parse_time(value, now=None):
+    """Datetime from ISO text or a relative age such as 30m, 12h, 7d."""
+    if value is None or isinstance(value, datetime):
+        return value
+    match = RELATIVE_TIME.match(value.strip().lower())
+    if match:
+        return (now or datetime.now()) - timedelta(**{TIME_UNITS[match[2]]: float(match[1])})
+    return datetime.fromisoformat(value.strip())
+
+
+def event_files(path):
+    """Event files for ``path`` and per-shard siblings, each stream's backups oldest first."""
+    path = Path(path)
+    streams = {}
+    for file in path.parent.glob(f'{path.stem}*{path.suffix}*'):
+        base, _, rest = file.name.partition(path.suffix)
+        rest = rest.lstrip('.')
+        number = rest.split('.')[0]
+        if rest.endswith('.tmp') or (rest and not number.isdigit()):
+            continue
+        index = int(number) if rest else 0
+        # While a backup is being compressed both n and n.gz can exist; keep the plain file
+        streams.setdefault(base + path.suffix, {}).setdefault(index, file)
+        if not file.name.endswith('.gz'):
+            streams[base + path.suffix][index] = file
+    return [[files[i] for i in sorted(files, reverse=True)] for _, files in sorted(streams.items())]
+
+
+def _read_lines(file):
+    opener = gzip.open if file.name.endswith('.gz') else open
+    try:
+        with opener(file, 'rt', encoding='utf-8') as f:
+            yield from f
+    except (FileNotFoundError, EOFError):
+        return  # rotated or still being compressed while we read
+
+
+def _read_stream(files, needles, match, since, until):
+    for file in files:
+        try:
+            if since and datetime.fromtimestamp(file.stat().st_mtime) < since:
+                continue  # written to last before the window opens: nothing in it can match
+        except FileNotFoundError:
+            continue
+        for line in _read_lines(file):
+            if not all(n in line for n in needles):
+                continue  # cheap substring check before paying for json.loads
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # partially written last line
+            ts = event.get('ts', '')
+            if until and ts >= until:
+                return  # files are append-only, so everything after this is later still
+            if (not since or ts >= since.isoformat(timespec='milliseconds')) and match(event):
+                yield event
+
+
+def iter_events(path, events=None, candidate=None, job_id=None, run_id=None, since=None, until=None):
+    """Stream matching events from the live and rotated files, merged in timestamp order."""
+    events = set(events or ())
+    since, until = parse_time(since), parse_time(until)
+    until = until.isoformat(timespec='milliseconds') if until else None
+    needles = [json.dumps(v, ensure_ascii=False)[1:-1] for v in (candidate, job_id, run_id) if v is not None]
+    if len(events) == 1:
+        needles.append(f'"event":{json.dumps(next(iter(events)), ensure_ascii=False)}')
+
+    def match(event):
+        return ((not events or event.get('event') in events) and (candidate is None or event.get('candidate') == candidate)
+                and (job_id is None or str(event.get('job_id')) == str(job_id)) and (run_id is None or event.get('run_id') == run_id))
+
+    streams = [_read_stream(files, needles, match, since, until) for files in event_files(path)]
+    return heapq.merge(*streams, key=lambda e: e.get('ts', ''))
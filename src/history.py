@@ -0,0 +1,73 @@
+"""Shared loader for data/applied_jobs.csv.
+
+Emails, titles, job ids and statuses repeat on almost every row, so they are
+read as categoricals; AppliedDate is parsed once here instead of in every
+view. Candidate and date-range filters are applied chunk by chunk on the raw
+strings, so only matching rows are converted and held in memory.
+"""
+
+import pandas as pd
+
+
+APPLIED_JOBS_COLUMNS = ['CandidateEmail', 'JobTitle', 'JobID', 'AppliedDate', 'Status']
+HISTORY_DTYPES = {'CandidateEmail': 'category', 'JobTitle': 'category', 'JobID': 'category', 'Status': 'category'}
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+CHUNK_ROWS = 250_000
+
+
+def empty_history(columns=None):
+    columns = columns or APPLIED_JOBS_COLUMNS
+    return pd.DataFrame({c: pd.Series(dtype='datetime64[ns]' if c == 'AppliedDate' else HISTORY_DTYPES[c]) for c in columns})
+
+
+def _compact(df):
+    for column in df.columns.intersection(list(HISTORY_DTYPES)):
+        if df[column].dtype != 'category':
+            df[column] = df[column].astype('category')
+    if 'AppliedDate' in df:
+        df['AppliedDate'] = pd.to_datetime(df['AppliedDate'], format=DATE_FORMAT, errors='coerce')
+    return df
+
+
+def iter_history(path, columns=None, candidate=None, start=None, end=None, chunksize=CHUNK_ROWS):
+    """Yield compact DataFrame chunks of the history, keeping only rows that match the filters."""
+    columns = list(columns or APPLIED_JOBS_COLUMNS)
+    needed = set(columns) | ({'CandidateEmail'} if candidate is not None else set()) | ({'AppliedDate'} if start or end else set())
+    usecols = [c for c in APPLIED_JOBS_COLUMNS if c in needed]
+    # AppliedDate is zero-padded, so string order is date order and the filter needs no parsing
+    start = pd.Timestamp(start).strftime(DATE_FORMAT) if start is not None else None
+    end = pd.Timestamp(end).strftime(DATE_FORMAT) if end is not None else None
+
+    with pd.read_csv(path, usecols=usecols, dtype=str, chunksize=chunksize) as reader:
+        for chunk in reader:
+            mask = None
+            if candidate is not None:
+                mask = chunk['CandidateEmail'] == candidate
+            if start is not None:
+                after = chunk['AppliedDate'] >= start
+                mask = after if mask is None else mask & after
+            if end is not None:
+                before = chunk['AppliedDate'] < end
+                mask = before if mask is None else mask & before
+            if mask is not None:
+                chunk = chunk[mask]
+            if len(chunk):
+                yield _compact(chunk[columns].copy())
+
+
+def load_history(path, columns=None, candidate=None, start=None, end=None, chunksize=CHUNK_ROWS):
+    """Load the history with categorical text columns and a parsed AppliedDate.
+
+    ``candidate`` keeps one CandidateEmail; ``start``/``end`` keep AppliedDate in
+    [start, end). Raises like ``pd.read_csv`` for missing or empty files.
+    """
+    columns = list(columns or APPLIED_JOBS_COLUMNS)
+    if candidate is None and start is None and end is None:
+        dtypes = {c: HISTORY_DTYPES[c] for c in columns if c in HISTORY_DTYPES}
+        return _compact(pd.read_csv(path, usecols=columns, dtype=dtypes))[columns]
+
+    chunks = list(iter_history(path, columns, candidate, start, end, chunksize))
+    if not chunks:
+        return empty_history(columns)
+    # Chunks carry different category sets, which concat widens to object; _compact narrows them again
+    return _compact(pd.concat(chunks, ignore_index=True))
@@ -6,9 +6,9 @@ import sys
 import time
 import random
 import logging
-import configparser
 from datetime import datetime
 from pathlib import Path
+from collections import Counter
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -21,49 +21,205 @@ from webdriver_manager.chrome import ChromeDriverManager
 from utils import setup_csv_logging
 from dotenv import load_dotenv
 from job_activity_logger import JobActivityLogger
+from relevance import RelevanceScorer, split_terms
+from settings import SettingsError, SettingsWatcher
+from recovery import DriverSupervisor, DriverUnavailableError, is_dead_session_error
+from memory_watchdog import MemoryWatchdog
+from candidates import iter_candidates
+from negative_cache import NegativeJobCache
+from command_metrics import CommandMetrics
+from result_pages import JOB_LISTING_XPATH, ResultPages, fallback_job_id
+from search_yield import SearchYieldTracker
+from history import load_history
+from event_log import EventLog
+
+
+CLOSED_POSTING_SCRIPT = '''
+return /no longer (available|accepting)|position has been filled|this job (is closed|has expired)|job not found/i
+    .test(document.body ? document.body.innerText : '');
+'''
+
+APPLY_BUTTON_SELECTORS = [
+    (By.XPATH, '//a[contains(@class, "quick-apply")]'),
+    (By.XPATH, '//a[contains(text(), "Apply")]'),
+    (By.XPATH, '//button[contains(text(), "Apply")]'),
+    (By.XPATH, '//input[@value="Apply"]')
+]
+
+# Quick-apply form controls; the same selector lists drive the scripted fill and the native fallback
+FORM_CONTROLS = {
+    'resume': [(By.ID, 'ContentPlaceHolder1_grdItem_btnSelect_0'), (By.ID, 'grdItem_btnSelect_0'),
+               (By.XPATH, "//input[@type='radio' and contains(@id, 'btnSelect')]")],
+    'linkedin': [(By.ID, 'ContentPlaceHolder1_txtLinkedInUrl'), (By.ID, 'txtLinkedInUrl')],
+    'phone': [(By.ID, 'ContentPlaceHolder1_txtPhone2'), (By.ID, 'txtPhone2')],
+    'min_req': [(By.ID, 'ContentPlaceHolder1_chkMinReq_0'), (By.ID, 'chkMinReq_0'), (By.XPATH, "//input[@value='Yes']")],
+    'apply': [(By.ID, 'ContentPlaceHolder1_cmdApply'), (By.ID, 'cmdApply'), (By.XPATH, "//input[@value='Apply Now']")],
+}
+FORM_WAIT_MS = 10000
+
+# Waits for the form, fills text fields, ticks the resume/requirement controls and submits, all in one round-trip.
+# Fields listed as native, or whose value the page rewrites (input masks), are handed back for send_keys instead.
+FILL_APPLICATION_SCRIPT = '''
+const [controls, values, nativeFields, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+function find(selectors) {
+    for (const [by, sel] of selectors) {
+        const el = by === 'id' ? document.getElementById(sel)
+            : document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (el) return [el, sel];
+    }
+    return [null, null];
+}
+const started = Date.now();
+(function attempt() {
+    const [apply, applySelector] = find(controls.apply);
+    if (!apply && Date.now() - started < timeoutMs) return setTimeout(attempt, 100);
+    const result = {variant: null, found: [], missing: [], set: [], needs_keys: [], apply: apply, submitted: false};
+    if (!apply) { result.missing.push('apply'); return done(result); }
+    result.variant = applySelector.startsWith('ContentPlaceHolder1_') ? 'content_placeholder' : applySelector.startsWith('/') ? 'generic' : 'plain';
+    for (const name of ['resume', 'min_req']) {
+        const [el] = find(controls[name]);
+        if (!el) { result.missing.push(name); continue; }
+        result.found.push(name);
+        if (!el.checked) el.click();
+        result.set.push(name);
+    }
+    for (const [name, value] of Object.entries(values)) {
+        const [el] = find(controls[name]);
+        if (!el) { result.missing.push(name); continue; }
+        result.found.push(name);
+        el.removeAttribute('readonly');
+        if (nativeFields.includes(name)) { result.needs_keys.push({name: name, element: el}); continue; }
+        Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        if (el.value === value) result.set.push(name);
+        else result.needs_keys.push({name: name, element: el});
+    }
+    if (!result.needs_keys.length) { apply.click(); result.submitted = true; }
+    done(result);
+})();
+'''
 
 
 class InsightGlobalJobBot:
-    def __init__(self, config_path='config/settings.ini'):
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, config_path='config/settings.ini', base_dir=None, record_path=None, shard=None):
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
+        self.shard = shard
+        self.record_path = record_path
+        self.recorder = None
         load_dotenv()
-        self.config = self._load_config(config_path)
+        self.settings_watcher = SettingsWatcher(self.base_dir / config_path, on_change=self._on_settings_change)
         self._setup_logging()
         self.activity_logger = JobActivityLogger()
         self.driver = None
         self.wait = None
         self.current_candidate = None
-
-    def _load_config(self, config_path):
-        config = configparser.ConfigParser()
-        config_file = self.base_dir / config_path
-        config.read(config_file)
-        return config
+        self.current_search = None
+        self.supervisor = DriverSupervisor(self, self.settings.recovery_max_restarts, self.settings.recovery_window_seconds)
+        self.memory_watchdog = self._build_memory_watchdog()
+        self.negative_cache = self._build_negative_cache()
+        self.search_yield = self._build_search_yield()
+        self.search_stats = Counter()
+        self.command_metrics = CommandMetrics() if self.settings.metrics_enabled else None
+        self.run_stats = Counter()
+        self.relevance = self._build_relevance_scorer()
+
+    @property
+    def settings(self):
+        return self.settings_watcher.current
+
+    def _on_settings_change(self, old, new):
+        if (old.relevance_enabled, old.relevance_keywords, old.relevance_threshold, old.keywords) != \
+                (new.relevance_enabled, new.relevance_keywords, new.relevance_threshold, new.keywords):
+            self.relevance = self._build_relevance_scorer()
+        if self.memory_watchdog:
+            self.memory_watchdog.max_rss_mb = new.watchdog_max_rss_mb
+            self.memory_watchdog.recycle_after_applications = new.watchdog_recycle_after_applications
+        if self.negative_cache:
+            self.negative_cache.ttl_seconds = new.negative_cache_ttl_hours * 3600
+        if self.search_yield:
+            self.search_yield.exploration = new.search_order_exploration
+            self.search_yield.decay = new.search_order_decay
+        if (old.recovery_max_restarts, old.recovery_window_seconds) != (new.recovery_max_restarts, new.recovery_window_seconds):
+            self.supervisor.breaker.max_failures = new.recovery_max_restarts
+            self.supervisor.breaker.window_seconds = new.recovery_window_seconds
+        if old.log_level != new.log_level:
+            logging.getLogger().setLevel(getattr(logging, new.log_level.upper()))
+        if old.explicit_wait != new.explicit_wait and self.driver:
+            self.wait = WebDriverWait(self.driver, new.explicit_wait)
 
     def _setup_logging(self):
         log_dir = self.base_dir / 'logs'
         log_dir.mkdir(exist_ok=True)
-        self.log_file = log_dir / f'jobbot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_file = log_dir / f'jobbot_{self.run_id}.log'
 
-        log_level = getattr(logging, self.config.get('logging', 'log_level', fallback='INFO').upper(), logging.INFO)
+        settings = self.settings
+        log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
         handlers = [logging.FileHandler(self.log_file), logging.StreamHandler(sys.stdout)]
 
-        if self.config.getboolean('logging', 'csv_logging_enabled', fallback=True):
+        if settings.csv_logging_enabled:
             try:
-                handlers.append(setup_csv_logging(self.config.get('logging', 'csv_log_file', fallback='logs/jobbot_logs.csv'), log_level))
+                handlers.append(setup_csv_logging(self.base_dir / settings.csv_log_file, log_level))
             except Exception as e: print(f'CSV logging error: {e}')
 
         logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s - %(message)s', handlers=handlers)
         self.logger = logging.getLogger(__name__)
+        self.events = self._build_event_log()
         self.logger.info('Bot initialized')
 
+    def _build_event_log(self):
+        settings = self.settings
+        if not settings.events_enabled:
+            return None
+        path = self.base_dir / settings.events_file
+        if self.shard:
+            # Shard workers run concurrently; each rotates its own file
+            path = path.with_name(f'{path.stem}.shard{self.shard[0]}-{self.shard[1]}{path.suffix}')
+        try:
+            return EventLog(path, int(settings.events_max_mb * 1024 * 1024), settings.events_backup_count, run_id=self.run_id,
+                            shard=f'{self.shard[0]}/{self.shard[1]}' if self.shard else None)
+        except OSError as e:
+            self.logger.error(f'Event log disabled: {e}')
+            return None
+
+    def _event(self, event, candidate=None, job_id=None, started=None, **fields):
+        if self.events:
+            self.events.emit(event, candidate['Email'] if candidate else None, job_id,
+                             time.monotonic() - started if started is not None else None, **fields)
+
+    def _build_relevance_scorer(self):
+        settings = self.settings
+        if not settings.relevance_enabled:
+            return None
+        return RelevanceScorer(settings.relevance_keywords or settings.keywords, settings.relevance_threshold)
+
+    def _build_memory_watchdog(self):
+        settings = self.settings
+        if not settings.watchdog_enabled:
+            return None
+        return MemoryWatchdog(self.base_dir / settings.watchdog_log_file, settings.watchdog_max_rss_mb,
+                              settings.watchdog_recycle_after_applications, settings.watchdog_sample_seconds, self.run_id)
+
+    def _build_negative_cache(self):
+        settings = self.settings
+        if not settings.negative_cache_enabled:
+            return None
+        return NegativeJobCache(self.base_dir / settings.negative_cache_file, settings.negative_cache_ttl_hours * 3600)
+
+    def _build_search_yield(self):
+        settings = self.settings
+        if not settings.search_order_adaptive:
+            return None
+        return SearchYieldTracker(self.base_dir / settings.search_order_file, settings.search_order_exploration, settings.search_order_decay)
+
     def random_wait(self, min_sec=None, max_sec=None):
+        settings = self.settings
         if min_sec is None:
-            min_sec = float(self.config.get(
-                'bot', 'random_delay_min', fallback=2))
+            min_sec = settings.random_delay_min
         if max_sec is None:
-            max_sec = float(self.config.get(
-                'bot', 'random_delay_max', fallback=5))
+            max_sec = settings.random_delay_max
         delay = random.uniform(min_sec, max_sec)
         time.sleep(delay)
 
@@ -72,32 +228,47 @@ class InsightGlobalJobBot:
             options = webdriver.ChromeOptions()
             for arg in ['--disable-blink-features=AutomationControlled', '--start-maximized', '--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu', 'user-agent=Mozilla/5.0']:
                 options.add_argument(arg)
-            if self.config.getboolean('bot', 'headless', fallback=False): options.add_argument('--headless')
-
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-            self.driver.implicitly_wait(int(self.config.get('bot', 'implicit_wait', fallback=10)))
-            self.wait = WebDriverWait(self.driver, int(self.config.get('bot', 'explicit_wait', fallback=30)))
+            if self.settings.headless: options.add_argument('--headless')
+
+            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            if self.recorder:
+                self.recorder.rebind(driver.command_executor)
+                driver.command_executor = self.recorder
+            elif self.record_path:
+                from replay import CommandRecorder
+                self.recorder = CommandRecorder(driver.command_executor, self.record_path, driver.caps)
+                driver.command_executor = self.recorder
+                self.logger.info(f'Recording WebDriver session to {self.record_path}')
+            if self.command_metrics: driver.command_executor = self.command_metrics.wrap(driver.command_executor)
+            self.attach_driver(driver)
             return True
         except Exception as e:
             self.logger.error(f'Driver setup failed: {e}')
             return False
 
+    def attach_driver(self, driver):
+        self.driver = driver
+        if self.memory_watchdog: self.memory_watchdog.attach(driver)
+        self.driver.implicitly_wait(self.settings.implicit_wait)
+        self.wait = WebDriverWait(self.driver, self.settings.explicit_wait)
+
     def _find_element(self, selectors, wait_time=5):
         for by_method, selector in selectors:
             try:
                 return WebDriverWait(self.driver, wait_time).until(EC.presence_of_element_located((by_method, selector)))
-            except: continue
+            except Exception as e:
+                if is_dead_session_error(e): raise
+                continue
         return None
 
     def load_candidates(self):
+        """Stream active candidates (of this process's shard) from data/candidates.csv."""
+        candidates_file = self.base_dir / 'data' / 'candidates.csv'
+        if not candidates_file.exists(): return
         try:
-            candidates_file = self.base_dir / 'data' / 'candidates.csv'
-            if not candidates_file.exists(): return []
-            df = pd.read_csv(candidates_file)
-            return df[df['Status'].str.lower() == 'active'].to_dict('records')
+            yield from iter_candidates(candidates_file, self.shard)
         except Exception as e:
             self.logger.error(f'Error loading candidates: {e}')
-            return []
 
     def login(self, email, password):
         try:
@@ -125,6 +296,7 @@ class InsightGlobalJobBot:
             self.random_wait(0.5, 1.5)
 
             password_field.clear()
+            if self.recorder: self.recorder.redact(password)
             password_field.send_keys(password)
             self.random_wait(0.5, 1.5)
 
@@ -192,8 +364,7 @@ class InsightGlobalJobBot:
                 df.to_csv(applied_file, index=False)
                 return set()
 
-            df = pd.read_csv(applied_file)
-            candidate_jobs = df[df['CandidateEmail'] == candidate_email]
+            candidate_jobs = load_history(applied_file, columns=['JobID'], candidate=candidate_email)
             return set(candidate_jobs['JobID'].astype(str))
 
         except pd.errors.EmptyDataError:
@@ -239,107 +410,459 @@ class InsightGlobalJobBot:
             self.logger.error(f'Error saving applied job: {e}', extra={
                               'candidate_email': candidate_email})
 
+    @staticmethod
+    def _parse_job_id(job_href, fallback):
+        job_id = None
+        if job_href:
+            if 'jobid=' in job_href: job_id = job_href.split('jobid=')[1].split('&')[0]
+            elif '/job/' in job_href: job_id = job_href.split('/job/')[1].split('/')[0].split('?')[0]
+        return job_id or fallback
+
+    def _irrelevant_listings(self, candidate, applied_jobs, listings):
+        if not self.relevance:
+            return set()
+        pending = [(idx, l) for idx, l in enumerate(listings) if l['job_id'] not in applied_jobs]
+        if not pending:
+            return set()
+
+        include = split_terms(candidate.get('IncludeKeywords'))
+        exclude = split_terms(candidate.get('ExcludeKeywords'))
+        mask = self.relevance.relevant_mask([l['title'] for _, l in pending], include, exclude)
+        skipped = {idx for (idx, _), relevant in zip(pending, mask) if not relevant}
+        self.logger.info(f'Relevance filter: {len(skipped)}/{len(pending)} unseen listings below threshold', extra={
+                         'candidate_email': candidate['Email']})
+        return skipped
+
     def apply_to_jobs(self, candidate, max_applications=10):
+        applied_before = self.search_stats['applied']
         try:
             applied_jobs = self.get_applied_jobs(candidate['Email'])
-            count = 0
-            job_index = 0
+            pages = ResultPages(self, JOB_LISTING_XPATH, self.settings.max_result_pages,
+                                recover=lambda error: self._recover_if_dead(error, candidate))
+            if self.settings.deep_link_apply:
+                return self._apply_by_deep_link(candidate, max_applications, applied_jobs, pages)
+            if self.settings.tab_pipelining:
+                return self._apply_in_tabs(candidate, max_applications, applied_jobs, pages)
 
-            while count < max_applications:
-                try:
-                    jobs = self.driver.find_elements(By.XPATH, '//div[@class="job-title"]')
-                    if job_index >= len(jobs): break
-                    job = jobs[job_index]
-                except: break
+            count = 0
+            for page in pages:
+                listings = page['listings']
+                already = self._count_listings(listings, applied_jobs)
+                irrelevant = self._irrelevant_listings(candidate, applied_jobs, listings)
+                negative = self._negative_listings(listings, applied_jobs, irrelevant)
+                self._skip_events(candidate, listings, applied_jobs, irrelevant, negative)
+                pending = len(listings) - len(irrelevant) - len(negative) - already
+                if page['number'] > 1 and pending <= 0:
+                    # Every listing is applied to, irrelevant or known dead: never navigate to it
+                    self.run_stats['navigations_avoided'] += len(irrelevant)
+                    self.run_stats['result_pages_skipped'] += 1
+                    for probe_seconds in negative.values():
+                        self.negative_cache.skipped(probe_seconds)
+                    continue
 
-                try:
-                    self.driver.execute_script('window.scrollTo(0, 0);')
-                    self.driver.execute_script('arguments[0].scrollIntoView({block: "center"});', job)
-                    self.random_wait(1, 2)
-
-                    job_title = job.text.strip().split('\n')[0]
-                    job_href = job.find_element(By.XPATH, ".//a").get_attribute('href')
-                    job_id = None
-                    if job_href:
-                        if 'jobid=' in job_href: job_id = job_href.split('jobid=')[1].split('&')[0]
-                        elif '/job/' in job_href: job_id = job_href.split('/job/')[1].split('/')[0].split('?')[0]
-                    
-                    if not job_id: job_id = job.get_attribute('data-job-id') or job.get_attribute('id') or f'job_{job_index}'
-
-                    if job_id in applied_jobs:
-                        job_index += 1
-                        continue
-
-                    self.driver.execute_script('arguments[0].click();', job)
-                    self.random_wait()
-
-                    apply_btn = self._find_element([
-                        (By.XPATH, '//a[contains(@class, "quick-apply")]'),
-                        (By.XPATH, '//a[contains(text(), "Apply")]'),
-                        (By.XPATH, '//button[contains(text(), "Apply")]'),
-                        (By.XPATH, '//input[@value="Apply"]')
-                    ])
-
-                    if not apply_btn:
-                        self.save_applied_job(candidate['Email'], job_title, job_id, 'No Apply Button')
-                        self.driver.back()
-                    else:
-                        self.driver.execute_script('arguments[0].click();', apply_btn)
-                        self.random_wait()
-                        if self.fill_application_form(candidate):
-                            self.save_applied_job(candidate['Email'], job_title, job_id, 'Applied')
-                            count += 1
-                        else:
-                            self.save_applied_job(candidate['Email'], job_title, job_id, 'Form Error')
-                    
-                    self.random_wait()
-                except Exception as e:
-                    self.logger.error(f'Error applying to job: {e}')
-                job_index += 1
+                pages.open(page)
+                # By JobID, not position: the results page may re-render in a different order after each back()
+                skip_ids = {listings[idx]['job_id'] for idx in irrelevant}
+                negative_ids = {listings[idx]['job_id']: probe_seconds for idx, probe_seconds in negative.items()}
+                count += self._apply_on_page(candidate, page, pages, applied_jobs, skip_ids, negative_ids, max_applications - count)
+                if count >= max_applications:
+                    break
 
             self.logger.info(f'Applied to {count} jobs for {candidate["Email"]}')
             return count
+        except DriverUnavailableError:
+            raise
         except Exception as e:
-            self.logger.error(f'Apply process error: {e}')
-            return 0
+            # Applications already submitted in this search still count towards the candidate's quota and the API total
+            applied = self.search_stats['applied'] - applied_before
+            self.logger.error(f'Apply process error after {applied} applications: {e}')
+            return applied
+
+    def _apply_on_page(self, candidate, page, pages, applied_jobs, irrelevant, negative, max_applications):
+        """Click through the listings of the results page the browser is on; later pages are reloaded by URL."""
+        first_page = page['number'] == 1
+        count = 0
+        job_index = 0
+
+        while count < max_applications:
+            try:
+                jobs = self.driver.find_elements(By.XPATH, JOB_LISTING_XPATH)
+                if job_index >= len(jobs): break
+                job = jobs[job_index]
+            except Exception as e:
+                if self._recover_if_dead(e, candidate):
+                    pages.open(page)
+                    continue
+                break
 
-    def fill_application_form(self, candidate):
+            try:
+                job_href = job.find_element(By.XPATH, ".//a").get_attribute('href')
+                href_id = self._parse_job_id(job_href, None)
+                job_id = href_id or job.get_attribute('data-job-id') or job.get_attribute('id') or fallback_job_id(page['number'], job_index)
+
+                if job_id in irrelevant:
+                    self.run_stats['navigations_avoided'] += 1
+                    job_index += 1
+                    continue
+                if job_id in negative:
+                    self.negative_cache.skipped(negative[job_id])
+                if job_id in applied_jobs or job_id in negative:
+                    job_index += 1
+                    continue
+
+                self.driver.execute_script('window.scrollTo(0, 0);')
+                self.driver.execute_script('arguments[0].scrollIntoView({block: "center"});', job)
+                self.random_wait(1, 2)
+                job_title = job.text.strip().split('\n')[0]
+
+                started = time.monotonic()
+                self.driver.execute_script('arguments[0].click();', job)
+                self.random_wait()
+
+                if self._apply_from_detail_page(candidate, job_title, job_id, navigate_back=first_page, started=started,
+                                                cacheable=href_id is not None):
+                    count += 1
+                pages.open(page)
+                self.random_wait()
+            except DriverUnavailableError:
+                raise
+            except Exception as e:
+                if self._recover_if_dead(e, candidate):  # retry the same job on the new session
+                    pages.open(page)
+                    continue
+                self.logger.error(f'Error applying to job: {e}')
+            job_index += 1
+            if self._recycle_if_needed(candidate, self.current_search):
+                pages.open(page)
+
+        return count
+
+    def _negative_listings(self, listings, applied_jobs, skipped):
+        """{index: probe_seconds} of the listings the negative cache knows cannot be applied to.
+
+        Only real JobIDs (parsed from the link) are looked up; position-based fallback IDs never go into the cache.
+        """
+        if not self.negative_cache:
+            return {}
+        negative = {}
+        for idx, listing in enumerate(listings):
+            if idx in skipped or listing['job_id'] in applied_jobs or not listing.get('id_from_href'):
+                continue
+            entry = self.negative_cache.lookup(listing['job_id'])
+            if entry:
+                self.logger.debug(f'Skipping job {listing["job_id"]}: {entry[0]} (negative cache)')
+                negative[idx] = entry[1]
+                if self.recorder: self.recorder.mark_negative_hit(listing['job_id'], *entry)
+        return negative
+
+    def _posting_closed(self):
         try:
-            resume_radio = self._find_element([
-                (By.ID, 'ContentPlaceHolder1_grdItem_btnSelect_0'),
-                (By.ID, 'grdItem_btnSelect_0'),
-                (By.XPATH, "//input[@type='radio' and contains(@id, 'btnSelect')]")
-            ])
-            if resume_radio: self.driver.execute_script('arguments[0].click();', resume_radio)
-
-            for field_type, selectors, value in [
-                ('LinkedIn', [(By.ID, 'ContentPlaceHolder1_txtLinkedInUrl'), (By.ID, 'txtLinkedInUrl')], candidate.get('LinkedInUrl', '')),
-                ('Phone', [(By.ID, 'ContentPlaceHolder1_txtPhone2'), (By.ID, 'txtPhone2')], candidate['Phone'])
-            ]:
-                field = self._find_element(selectors)
-                if field:
-                    self.driver.execute_script("arguments[0].removeAttribute('readonly');", field)
-                    field.clear()
-                    field.send_keys(value)
-
-            min_req = self._find_element([(By.ID, 'ContentPlaceHolder1_chkMinReq_0'), (By.ID, 'chkMinReq_0'), (By.XPATH, "//input[@value='Yes']")])
-            if min_req: self.driver.execute_script('arguments[0].click();', min_req)
-
-            apply_now = self._find_element([(By.ID, 'ContentPlaceHolder1_cmdApply'), (By.ID, 'cmdApply'), (By.XPATH, "//input[@value='Apply Now']")])
-            if apply_now:
-                self.driver.execute_script('arguments[0].click();', apply_now)
-                self.random_wait(2, 3)
-            else: return False
-
-            back_btn = self._find_element([(By.XPATH, "//a[contains(text(), 'Back to Search')]")], 10)
-            if back_btn: self.driver.execute_script('arguments[0].click();', back_btn)
-            else: self.driver.back()
-            
+            return bool(self.driver.execute_script(CLOSED_POSTING_SCRIPT))
+        except Exception as e:
+            if is_dead_session_error(e): raise
+            return False
+
+    def _apply_from_detail_page(self, candidate, job_title, job_id, navigate_back=True, started=None, cacheable=False):
+        apply_btn = self._find_element(APPLY_BUTTON_SELECTORS)
+
+        if not apply_btn:
+            # Neither outcome depends on the candidate, so remember it for everyone
+            status = 'Closed Posting' if self._posting_closed() else 'No Apply Button'
+            self.save_applied_job(candidate['Email'], job_title, job_id, status)
+            self._event('job_skipped', candidate, job_id, started, reason=status, title=job_title)
+            if navigate_back: self.driver.back()
+            if self.negative_cache and cacheable:
+                self.negative_cache.add(job_id, status, time.monotonic() - started if started else 0.0)
+            return False
+
+        self.driver.execute_script('arguments[0].click();', apply_btn)
+        self.random_wait()
+        return self._submit_application(candidate, job_title, job_id, navigate_back, started)
+
+    def _submit_application(self, candidate, job_title, job_id, navigate_back=True, started=None):
+        if self.fill_application_form(candidate, navigate_back):
+            self.search_stats['applied'] += 1
+            self.save_applied_job(candidate['Email'], job_title, job_id, 'Applied')
+            self._event('applied', candidate, job_id, started, title=job_title, search=self._search_label())
+            if self.memory_watchdog: self.memory_watchdog.record_application()
+            return True
+        self.save_applied_job(candidate['Email'], job_title, job_id, 'Form Error')
+        self._event('form_error', candidate, job_id, started, title=job_title, search=self._search_label())
+        return False
+
+    def _search_label(self):
+        return f'{self.current_search[0]} in {self.current_search[1]}' if self.current_search else None
+
+    def _open_tab(self, url):
+        """Open url in a background tab of the same session without blocking on its load."""
+        known = set(self.driver.window_handles)
+        self.driver.execute_script('window.open(arguments[0], "_blank");', url)
+        opened = [h for h in self.driver.window_handles if h not in known]
+        return opened[0] if opened else None
+
+    def _count_listings(self, listings, applied_jobs):
+        already = sum(l['job_id'] in applied_jobs for l in listings)
+        self.search_stats['listings'] += len(listings)
+        self.search_stats['already_applied'] += already
+        return already
+
+    def _skip_events(self, candidate, listings, applied_jobs, irrelevant, negative):
+        if not self.events:
+            return
+        for idx, listing in enumerate(listings):
+            reason = ('already_applied' if listing['job_id'] in applied_jobs else 'irrelevant' if idx in irrelevant
+                      else 'negative_cache' if idx in negative else None)
+            if reason:
+                self._event('job_skipped', candidate, listing['job_id'], reason=reason, title=listing['title'])
+
+    def _pending_listings(self, candidate, applied_jobs, page):
+        listings = page['listings']
+        self._count_listings(listings, applied_jobs)
+        irrelevant = self._irrelevant_listings(candidate, applied_jobs, listings)
+        negative = self._negative_listings(listings, applied_jobs, irrelevant)
+        self._skip_events(candidate, listings, applied_jobs, irrelevant, negative)
+        # Irrelevant and negative-cached listings stay queued (marked) so a skip is only counted once the bot gets that far
+        pending = []
+        for idx, listing in enumerate(listings):
+            if listing['job_id'] in applied_jobs:
+                continue
+            if idx in irrelevant:
+                pending.append(dict(listing, skip='irrelevant'))
+            elif idx in negative:
+                pending.append(dict(listing, skip='negative', probe_seconds=negative[idx]))
+            elif listing.get('href'):
+                pending.append(listing)
+        return pending
+
+    def _skip_queued(self, listing):
+        """Credit the skip of a marked listing the bot has reached; False if the listing is to be opened."""
+        if listing.get('skip') == 'irrelevant':
+            self.run_stats['navigations_avoided'] += 1
+        elif listing.get('skip') == 'negative':
+            self.negative_cache.skipped(listing['probe_seconds'])
+        else:
+            return False
+        return True
+
+    @staticmethod
+    def _next_open(queue, position):
+        """Index of the first listing at or after position that is not marked as skipped, or None."""
+        return next((i for i in range(position, len(queue)) if 'skip' not in queue[i]), None)
+
+    def _apply_in_tabs(self, candidate, max_applications, applied_jobs, pages):
+        """Keep the results page in its own tab and work through job pages in preloaded tabs."""
+        remaining_pages = iter(pages)
+        queue = []
+        results_tab = pages.prefetch_window = self.driver.current_window_handle  # never navigated: later pages load ahead in it
+        next_tab = None
+        count = 0
+        position = 0
+
+        while count < max_applications:
+            # Queue one job beyond the current one (fetching further result pages as needed) so it can preload
+            while remaining_pages is not None and sum('skip' not in l for l in queue[position:]) < min(2, max_applications - count):
+                restarts = self.supervisor.restarts
+                page = next(remaining_pages, None)
+                if self.supervisor.restarts != restarts:
+                    # The browser was restarted while the page was fetched: the old tabs are gone
+                    results_tab, next_tab = pages.prefetch_window, None
+                if page is None:
+                    remaining_pages = None
+                else:
+                    queue.extend(self._pending_listings(candidate, applied_jobs, page))
+            if position >= len(queue):
+                break
+            listing = queue[position]
+            if self._skip_queued(listing):
+                position += 1
+                continue
+            try:
+                started = time.monotonic()
+                tab, next_tab = next_tab, None
+                if tab:
+                    self.driver.switch_to.window(tab)
+                else:
+                    self.driver.switch_to.new_window('tab')
+                    self.driver.get(listing['href'])
+                self.random_wait(1, 2)
+
+                # Start loading the next job while this one is being applied to
+                upcoming = self._next_open(queue, position + 1)
+                if upcoming is not None and count + 1 < max_applications:
+                    next_tab = self._open_tab(queue[upcoming]['href'])
+
+                if self._apply_from_detail_page(candidate, listing['title'], listing['job_id'], navigate_back=False, started=started,
+                                                cacheable=listing.get('id_from_href', False)):
+                    count += 1
+                self.run_stats['results_reloads_avoided_tabs'] += 1
+                self.driver.close()
+                self.driver.switch_to.window(next_tab or results_tab)
+                self.random_wait()
+            except DriverUnavailableError:
+                raise
+            except Exception as e:
+                if self._recover_if_dead(e, candidate):
+                    results_tab, next_tab = self.driver.current_window_handle, None
+                    pages.prefetch_window = results_tab
+                    continue
+                self.logger.error(f'Error applying to job: {e}')
+                self._close_tabs(keep=(results_tab, next_tab))
+            position += 1
+            if self._recycle_if_needed(candidate, self.current_search):
+                results_tab, next_tab = self.driver.current_window_handle, None
+                pages.prefetch_window = results_tab
+
+        if next_tab:
+            self._close_tabs(keep=(results_tab,))
+        self.driver.switch_to.window(results_tab)
+        self.logger.info(f'Applied to {count} jobs for {candidate["Email"]}')
+        return count
+
+    def _apply_by_deep_link(self, candidate, max_applications, applied_jobs, pages):
+        """Open each job's detail (or apply) URL directly; the results page is never reloaded or scrolled."""
+        count = 0
+        for page in pages:
+            for listing in self._pending_listings(candidate, applied_jobs, page):
+                if count >= max_applications:
+                    break
+                if self._skip_queued(listing):
+                    continue
+                for attempt in range(2):
+                    try:
+                        if self._apply_by_url(candidate, listing):
+                            count += 1
+                        self.run_stats['results_reloads_avoided_deep_link'] += 1
+                        break
+                    except DriverUnavailableError:
+                        raise
+                    except Exception as e:
+                        if attempt == 0 and self._recover_if_dead(e, candidate): continue  # retry on the new session
+                        self.logger.error(f'Error applying to job: {e}')
+                        break
+                self.random_wait()
+                self._recycle_if_needed(candidate, self.current_search)
+            if count >= max_applications:
+                break
+
+        self.logger.info(f'Applied to {count} jobs for {candidate["Email"]}')
+        return count
+
+    def _apply_by_url(self, candidate, listing):
+        started = time.monotonic()
+        template = self.settings.apply_url_template
+        href_job_id = self._parse_job_id(listing['href'], None)
+        if not (template and href_job_id):
+            self.driver.get(listing['href'])
+            self.random_wait(1, 2)
+            return self._apply_from_detail_page(candidate, listing['title'], listing['job_id'], navigate_back=False, started=started,
+                                                cacheable=listing.get('id_from_href', False))
+
+        # Straight to the application form, skipping the detail page and its Apply button
+        self.driver.get(template.format(job_id=href_job_id))
+        self.random_wait(1, 2)
+        if self._submit_application(candidate, listing['title'], listing['job_id'], navigate_back=False, started=started):
+            return True
+        if self.negative_cache and listing.get('id_from_href') and self._posting_closed():
+            self.negative_cache.add(listing['job_id'], 'Closed Posting', time.monotonic() - started)
+        return False
+
+    def _close_tabs(self, keep):
+        for handle in self.driver.window_handles:
+            if handle not in keep:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(next(h for h in keep if h))
+
+    def _recycle_if_needed(self, candidate=None, search=None):
+        reason = self.memory_watchdog.should_recycle() if self.memory_watchdog else None
+        if not reason:
+            return False
+        ok = self.supervisor.recycle(candidate, search, reason)
+        self.memory_watchdog.recycled()
+        return ok
+
+    def _recover_if_dead(self, error, candidate):
+        if self.supervisor.session_alive():
+            return False
+        self.logger.error(f'Browser session lost: {error}', extra={'candidate_email': candidate['Email']})
+        return self.supervisor.recover(candidate, self.current_search, reason=type(error).__name__)
+
+    def fill_application_form(self, candidate, navigate_back=True):
+        try:
+            values = {'linkedin': str(candidate.get('LinkedInUrl') or ''), 'phone': str(candidate['Phone'])}
+            submitted = self._fill_form_scripted(values) if self.settings.scripted_form_fill else None
+            if submitted is None: submitted = self._fill_form_native(values)
+            if not submitted: return False
+            self.random_wait(2, 3)
+
+            if navigate_back:
+                back_btn = self._find_element([(By.XPATH, "//a[contains(text(), 'Back to Search')]")], 10)
+                if back_btn: self.driver.execute_script('arguments[0].click();', back_btn)
+                else: self.driver.back()
+
             return True
         except Exception as e:
+            if is_dead_session_error(e): raise
             self.logger.error(f'Form fill error: {e}')
             return False
 
+    def _fill_form_scripted(self, values):
+        """Fill and submit the form with one injected script; None means fall back to the native path."""
+        try:
+            result = self.driver.execute_async_script(FILL_APPLICATION_SCRIPT, FORM_CONTROLS, values,
+                                                      list(self.settings.native_key_fields), FORM_WAIT_MS)
+        except Exception as e:
+            if is_dead_session_error(e): raise
+            self.logger.warning(f'Scripted form fill failed, using native input: {e}')
+            return None
+
+        self.logger.debug(f'Form fill ({result.get("variant")}): set {result.get("set")}, missing {result.get("missing")}, '
+                          f'native {[f["name"] for f in result.get("needs_keys", [])]}')
+        if not result.get('apply'): return False
+        for field in result.get('needs_keys', []):
+            field['element'].clear()
+            field['element'].send_keys(values[field['name']])
+        if not result.get('submitted'):
+            self.driver.execute_script('arguments[0].click();', result['apply'])
+        return True
+
+    def _fill_form_native(self, values):
+        resume_radio = self._find_element(FORM_CONTROLS['resume'])
+        if resume_radio: self.driver.execute_script('arguments[0].click();', resume_radio)
+
+        for name, value in values.items():
+            field = self._find_element(FORM_CONTROLS[name])
+            if field:
+                self.driver.execute_script("arguments[0].removeAttribute('readonly');", field)
+                field.clear()
+                field.send_keys(value)
+
+        min_req = self._find_element(FORM_CONTROLS['min_req'])
+        if min_req: self.driver.execute_script('arguments[0].click();', min_req)
+
+        apply_now = self._find_element(FORM_CONTROLS['apply'])
+        if not apply_now: return False
+        self.driver.execute_script('arguments[0].click();', apply_now)
+        return True
+
+    def _order_searches(self, candidate, searches, quota):
+        ordered = self.search_yield.order(candidate['Email'], searches)
+        # Model-based comparison with the settings.ini order, reported in the run summary
+        for name, order in (('static', searches), ('adaptive', ordered)):
+            apps, minutes = self.search_yield.estimate(candidate['Email'], order, quota)
+            self.run_stats[f'yield_{name}_apps'] += apps
+            self.run_stats[f'yield_{name}_minutes'] += minutes
+        if ordered != searches:
+            self.logger.info(f'Search order by expected yield: {", ".join(f"{k} in {l}" for k, l in ordered)}')
+        return ordered
+
+    def _record_search_yield(self, candidate, search, applications, seconds):
+        self.run_stats['search_applications'] += applications
+        self.run_stats['search_seconds'] += seconds
+        if self.search_yield:
+            self.search_yield.record(candidate['Email'], search, applications, seconds, self.search_stats['listings'],
+                                     self.search_stats['already_applied'])
+
     def logout(self):
         try:
             # Try multiple logout selectors
@@ -376,60 +899,84 @@ class InsightGlobalJobBot:
             # Even if logout fails, we can continue to next candidate
             return True
 
-    def process_candidate(self, candidate):
+    def run_candidate(self, candidate, searches=None):
+        """One run-loop step: recycle at this safe point if due, make sure the browser is alive, then process."""
+        self._recycle_if_needed()
+        self.supervisor.ensure_alive()
+        return self.process_candidate(candidate, searches)
+
+    def _candidate_searches(self, candidate):
+        settings = self.settings
+        # Check if candidate has a preferred location, otherwise use config
+        if 'PreferredLocation' in candidate and candidate['PreferredLocation'] and str(candidate['PreferredLocation']).strip():
+            locations_list = [str(candidate['PreferredLocation']).strip()]
+            self.logger.info(
+                f'Using candidate preferred location: {locations_list[0]}')
+        else:
+            locations_list = list(settings.locations)
+            self.logger.info(f'Using config locations: {locations_list}')
+
+        searches = [(keyword, location) for keyword in settings.keywords for location in locations_list]
+        if self.search_yield:
+            searches = self._order_searches(candidate, searches, settings.max_applications_per_candidate)
+        return searches
+
+    def process_candidate(self, candidate, searches=None):
+        """Log in, run the candidate's searches and apply; ``searches`` overrides the configured, yield-ordered ones (replay)."""
         try:
             self.logger.info(f'Processing candidate: {candidate["Email"]}')
             self.current_candidate = candidate
 
+            # Snapshot search terms (and their order) for this candidate; delays and limits stay live
+            if searches is None:
+                searches = self._candidate_searches(candidate)
+            searches = [tuple(search) for search in searches]
+            if self.recorder:
+                self.recorder.mark_candidate(candidate, self.get_applied_jobs(candidate['Email']), searches)
+
             # Login
-            if not self.login(candidate['Email'], candidate['Password']):
+            started = time.monotonic()
+            logged_in = self.login(candidate['Email'], candidate['Password'])
+            if not logged_in and not self.supervisor.session_alive():
+                logged_in = self.supervisor.recover(candidate, reason='login failed')
+            self._event('login_ok' if logged_in else 'login_failed', candidate, started=started)
+            if not logged_in:
                 self.logger.error(f'Login failed for {candidate["Email"]}')
                 return False
 
-                # Get search keywords
-            keywords_list = self.config.get('search', 'keywords').split(',')
-
-            # Check if candidate has a preferred location, otherwise use config
-            if 'PreferredLocation' in candidate and candidate['PreferredLocation'] and str(candidate['PreferredLocation']).strip():
-                locations_list = [str(candidate['PreferredLocation']).strip()]
-                self.logger.info(
-                    f'Using candidate preferred location: {locations_list[0]}')
-            else:
-                locations_list = self.config.get(
-                    'search', 'location').split(',')
-                self.logger.info(f'Using config locations: {locations_list}')
-
-            max_apps = int(self.config.get(
-                'search', 'max_applications_per_candidate', fallback=10))
-
             total_applications = 0
 
             # Search and apply for each keyword-location combination
-            for keyword in keywords_list:
-                keyword = keyword.strip()
-                for location in locations_list:
-                    location = location.strip()
-
-                    if total_applications >= max_apps:
-                        break
-
-                    self.logger.info(f'Searching: {keyword} in {location}')
-
-                    if self.search_jobs(keyword, location):
-                        apps = self.apply_to_jobs(
-                            candidate, max_apps - total_applications)
-                        total_applications += apps
-
-                    if total_applications >= max_apps:
-                        break
+            for keyword, location in searches:
+                max_apps = self.settings.max_applications_per_candidate
+                if total_applications >= max_apps:
+                    break
+
+                self.logger.info(f'Searching: {keyword} in {location}')
+
+                self.current_search = (keyword, location)
+                self.search_stats = Counter()
+                started = time.monotonic()
+                searched = self.search_jobs(keyword, location)
+                if not searched and not self.supervisor.session_alive():
+                    searched = self.supervisor.recover(candidate, self.current_search, reason='search failed')
+                if searched:
+                    apps = self.apply_to_jobs(
+                        candidate, max_apps - total_applications)
+                    total_applications += apps
+                    self._record_search_yield(candidate, self.current_search, apps, time.monotonic() - started)
+                self._event('search_done', candidate, started=started, keyword=keyword, location=location, ok=searched,
+                            applications=apps if searched else 0, listings=self.search_stats['listings'],
+                            already_applied=self.search_stats['already_applied'])
 
             self.logger.info(
                 f'Total applications for {candidate["Email"]}: {total_applications}')
+            self._event('candidate_done', candidate, applications=total_applications)
 
             # Log activity to API if there were applications
             if total_applications > 0:
                 try:
-                    candidate_id = int(candidate.get('CandidateID', 0))
+                    candidate_id = int(float(candidate.get('CandidateID') or 0))
                     if candidate_id > 0:
                         notes = f"Applied to {total_applications} jobs. Log: {self.log_file.name}"
                         success = self.activity_logger.log_activity(
@@ -453,51 +1000,102 @@ class InsightGlobalJobBot:
 
             return True
 
+        except DriverUnavailableError:
+            raise
         except Exception as e:
             self.logger.error(
                 f'Error processing candidate {candidate["Email"]}: {e}')
             return False
 
+    def _log_run_summary(self):
+        self.logger.info('Run summary:')
+        self.logger.info(f'  Navigations avoided by relevance filter: {self.run_stats["navigations_avoided"]}')
+        for mode, label in (('tabs', 'tab pipelining'), ('deep_link', 'deep-link apply')):
+            if self.run_stats[f'results_reloads_avoided_{mode}']:
+                self.logger.info(f'  Results page reloads avoided by {label}: {self.run_stats[f"results_reloads_avoided_{mode}"]}')
+        self.logger.info(f'  Result pages scanned: {self.run_stats["result_pages"]} '
+                         f'(skipped without navigating: {self.run_stats["result_pages_skipped"]}, '
+                         f'prefetched in tab mode: {self.run_stats["result_pages_prefetched"]})')
+        self.logger.info(f'  Browser restarts: {self.supervisor.restarts} '
+                         f'(failed: {self.supervisor.failed_restarts}, recovery time: {self.supervisor.recovery_seconds:.1f}s)')
+        if self.negative_cache:
+            self.logger.info(f'  Negative job cache: {self.negative_cache.hits} hits, {self.negative_cache.added} new entries, '
+                             f'~{self.negative_cache.seconds_saved:.0f}s saved')
+        if self.memory_watchdog:
+            self.logger.info(f'  Browser recycles: {self.supervisor.recycles} ({self.supervisor.recycle_seconds:.1f}s), '
+                             f'peak browser RSS: {self.memory_watchdog.peak_rss_mb:.0f} MB')
+        if self.run_stats['search_seconds']:
+            realized = self.run_stats['search_applications'] / self.run_stats['search_seconds'] * 3600
+            self.logger.info(f'  Applications per hour of searching (measured): {realized:.1f}')
+            if self.run_stats['yield_static_minutes'] and self.run_stats['yield_adaptive_minutes']:
+                static = self.run_stats['yield_static_apps'] / self.run_stats['yield_static_minutes'] * 60
+                adaptive = self.run_stats['yield_adaptive_apps'] / self.run_stats['yield_adaptive_minutes'] * 60
+                # Same stats that chose the order, so this is what the model expects, not a measured gain
+                self.logger.info(f'  Model estimate: {adaptive:.1f}/h in yield order vs {static:.1f}/h in settings.ini order '
+                                 f'({adaptive - static:+.1f}/h, not measured)')
+        if self.command_metrics:
+            report_file = self.base_dir / 'logs' / f'webdriver_metrics_{self.run_id}.json'
+            try:
+                report = self.command_metrics.write_report(report_file, self.settings.metrics_top_offenders)
+                self.command_metrics.log_summary(report)
+                self.logger.info(f'  WebDriver command report: {report_file}')
+            except Exception as e:
+                self.logger.error(f'Could not write WebDriver command report: {e}')
+
     def run(self):
         try:
+            self.settings_watcher.start()
+            if self.memory_watchdog: self.memory_watchdog.start()
+            self._event('run_started')
+
             # Setup driver
             if not self.setup_driver():
                 self.logger.error('Failed to setup driver. Exiting.')
                 return
 
-            # Load candidates
-            candidates = self.load_candidates()
-
-            if not candidates:
-                self.logger.error('No active candidates found. Exiting.')
-                return
-
-            # Process each candidate
-            for idx, candidate in enumerate(candidates, 1):
-                self.logger.info(f'\n{'='*50}')
-                self.logger.info(
-                    f'Processing candidate {idx}/{len(candidates)}')
-                self.logger.info(f'{'='*50}\n')
-
-                self.process_candidate(candidate)
+            if self.shard:
+                self.logger.info(f'Processing shard {self.shard[0]}/{self.shard[1]} of the roster')
 
+            # Candidates are streamed from the roster as they are processed
+            processed = 0
+            for idx, candidate in enumerate(self.load_candidates(), 1):
                 # Add delay between candidates
-                if idx < len(candidates):
+                if idx > 1:
                     delay = random.uniform(30, 60)
                     self.logger.info(
                         f'Waiting {delay:.1f} seconds before next candidate...')
                     time.sleep(delay)
 
+                self.logger.info(f'\n{'='*50}')
+                self.logger.info(f'Processing candidate {idx}')
+                self.logger.info(f'{'='*50}\n')
+
+                self.run_candidate(candidate)
+                processed = idx
+
+            if not processed:
+                self.logger.error('No active candidates found. Exiting.')
+                return
+
             self.logger.info('\nAll candidates processed successfully!')
 
         except KeyboardInterrupt:
             self.logger.warning('Process interrupted by user')
+        except DriverUnavailableError as e:
+            self.logger.error(f'Stopping run, circuit breaker open: {e}')
         except Exception as e:
             self.logger.error(f'Unexpected error in run: {e}')
         finally:
+            self.settings_watcher.stop()
+            if self.memory_watchdog: self.memory_watchdog.stop()
+            self._log_run_summary()
             if self.driver:
                 self.driver.quit()
                 self.logger.info('Browser closed')
+            if self.events:
+                self.events.emit('run_done', applications=self.run_stats['search_applications'],
+                                 restarts=self.supervisor.restarts)
+                self.events.close()
 
 
 def main():
@@ -507,7 +1105,11 @@ def main():
     print('='*60)
     print()
 
-    bot = InsightGlobalJobBot()
+    try:
+        bot = InsightGlobalJobBot()
+    except SettingsError as e:
+        print(f'Invalid settings: {e}')
+        sys.exit(1)
     bot.run()
 
 
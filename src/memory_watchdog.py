@@ -0,0 +1,113 @@
+import csv
+import logging
+import socket
+import threading
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class MemoryWatchdog:
+    """Samples RSS of the chromedriver/Chrome process tree and decides when to recycle the browser.
+
+    Sampling runs on a background thread; ``should_recycle`` only reads the latest
+    sample so the bot can ask at every safe point for free.
+    """
+
+    def __init__(self, log_file, max_rss_mb=2048, recycle_after_applications=0, sample_seconds=30, run_id=None):
+        self.logger = logging.getLogger(__name__)
+        self.log_file = Path(log_file)
+        self.max_rss_mb = max_rss_mb
+        self.recycle_after_applications = recycle_after_applications
+        self.sample_seconds = sample_seconds
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')  # the bot passes its own, shared with logs and events
+        self.host = socket.gethostname()
+        self.pid = None
+        self.rss_mb = 0.0
+        self.peak_rss_mb = 0.0
+        self.processes = 0
+        self.applications = 0
+        self.applications_since_recycle = 0
+        self.recycles = 0
+        self._stop = threading.Event()
+        self._thread = None
+        if psutil is None:
+            self.logger.warning('psutil not installed; browser memory is not sampled (pip install psutil)')
+
+    def attach(self, driver):
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        self.pid = getattr(process, 'pid', None)
+        self.rss_mb = 0.0
+
+    def start(self):
+        if psutil is None or self.sample_seconds <= 0 or self._thread:
+            return
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='memory-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.sample_seconds):
+            try:
+                self.sample()
+            except Exception as e:
+                self.logger.debug(f'Memory sample failed: {e}')
+
+    def sample(self):
+        if psutil is None or self.pid is None:
+            return None
+        try:
+            root = psutil.Process(self.pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return None
+
+        rss = 0
+        for proc in tree:
+            try:
+                rss += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.rss_mb = rss / (1024 * 1024)
+        self.peak_rss_mb = max(self.peak_rss_mb, self.rss_mb)
+        self.processes = len(tree)
+        self._log_sample()
+        return self.rss_mb
+
+    def _log_sample(self):
+        new_file = not self.log_file.exists() or self.log_file.stat().st_size == 0
+        with open(self.log_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['timestamp', 'host', 'run_id', 'rss_mb', 'processes', 'applications', 'applications_since_recycle', 'recycles'])
+            writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), self.host, self.run_id, f'{self.rss_mb:.1f}', self.processes,
+                             self.applications, self.applications_since_recycle, self.recycles])
+
+    def record_application(self):
+        self.applications += 1
+        self.applications_since_recycle += 1
+
+    def should_recycle(self):
+        """Return a reason string when the browser should be recycled at the next safe point."""
+        if self.max_rss_mb and self.rss_mb >= self.max_rss_mb:
+            return f'browser RSS {self.rss_mb:.0f} MB >= {self.max_rss_mb} MB'
+        if self.recycle_after_applications and self.applications_since_recycle >= self.recycle_after_applications:
+            return f'{self.applications_since_recycle} applications since last recycle'
+        return None
+
+    def recycled(self):
+        self.recycles += 1
+        self.applications_since_recycle = 0
+        self.rss_mb = 0.0
@@ -0,0 +1,64 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class NegativeJobCache:
+    """TTL-bounded record of JobIDs that no candidate can apply to (no Apply button, closed posting).
+
+    Backed by SQLite so every candidate in a run and every worker process
+    (e.g. ``run --shard i/n``) shares the same entries.
+    """
+
+    def __init__(self, path, ttl_seconds=86400):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.added = 0
+        self.seconds_saved = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS negative_jobs (
+            job_id TEXT PRIMARY KEY,
+            reason TEXT NOT NULL,
+            recorded_at REAL NOT NULL,
+            probe_seconds REAL NOT NULL DEFAULT 0)''')
+        self.purge_expired()
+
+    def lookup(self, job_id):
+        """Return (reason, probe_seconds) for job_id if it is still fresh."""
+        with self._lock:
+            row = self._conn.execute('SELECT reason, probe_seconds FROM negative_jobs WHERE job_id = ? AND recorded_at >= ?',
+                                     (str(job_id), time.time() - self.ttl_seconds)).fetchone()
+        if row is None:
+            self.misses += 1
+        return row
+
+    def skipped(self, probe_seconds):
+        """Count a navigation the cache actually avoided."""
+        self.hits += 1
+        self.seconds_saved += probe_seconds
+
+    def add(self, job_id, reason, probe_seconds=0.0):
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO negative_jobs (job_id, reason, recorded_at, probe_seconds) VALUES (?, ?, ?, ?)',
+                               (str(job_id), reason, time.time(), probe_seconds))
+        self.added += 1
+
+    def purge_expired(self):
+        with self._lock:
+            deleted = self._conn.execute('DELETE FROM negative_jobs WHERE recorded_at < ?',
+                                         (time.time() - self.ttl_seconds,)).rowcount
+        if deleted:
+            self.logger.info(f'Expired {deleted} negative job cache entries')
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,123 @@
+import logging
+import time
+from collections import deque
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+
+
+# Substrings of errors raised once chromedriver or Chrome itself is gone
+DEAD_SESSION_MARKERS = (
+    'invalid session id', 'session deleted', 'chrome not reachable', 'disconnected',
+    'no such window', 'target window already closed', 'session not created',
+    'connection refused', 'max retries exceeded', 'failed to establish a new connection',
+    'remote end closed connection', 'connection aborted', 'connection reset',
+)
+
+
+class DriverUnavailableError(RuntimeError):
+    """Raised when the circuit breaker is open and the browser must not be restarted again."""
+
+
+def is_dead_session_error(error):
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in DEAD_SESSION_MARKERS)
+
+
+class CircuitBreaker:
+    """Opens once ``max_failures`` failures happen within ``window_seconds``."""
+
+    def __init__(self, max_failures=3, window_seconds=900):
+        self.max_failures = max_failures
+        self.window_seconds = window_seconds
+        self.failures = deque()
+
+    def record_failure(self):
+        now = time.monotonic()
+        self.failures.append(now)
+        while self.failures and now - self.failures[0] > self.window_seconds:
+            self.failures.popleft()
+        return self.is_open
+
+    @property
+    def is_open(self):
+        return len(self.failures) > self.max_failures
+
+
+class DriverSupervisor:
+    """Detects a dead WebDriver session and restarts the browser, restoring login and search."""
+
+    def __init__(self, bot, max_restarts=3, window_seconds=900):
+        self.bot = bot
+        self.logger = logging.getLogger(__name__)
+        self.breaker = CircuitBreaker(max_restarts, window_seconds)
+        self.restarts = 0
+        self.failed_restarts = 0
+        self.recovery_seconds = 0.0
+        self.recycles = 0
+        self.recycle_seconds = 0.0
+
+    def session_alive(self):
+        driver = self.bot.driver
+        if driver is None:
+            return False
+        try:
+            driver.window_handles
+            return True
+        except Exception as e:
+            return not is_dead_session_error(e)
+
+    def ensure_alive(self):
+        if not self.session_alive():
+            self.recover(reason='session found dead')
+
+    def restart_browser(self):
+        driver, self.bot.driver = self.bot.driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        return self.bot.setup_driver()
+
+    def _restart_and_restore(self, candidate, search):
+        ok = self.restart_browser()
+        if ok and candidate is not None:
+            ok = self.bot.login(candidate['Email'], candidate['Password'])
+        if ok and search is not None:
+            ok = self.bot.search_jobs(*search)
+        return ok
+
+    def recycle(self, candidate=None, search=None, reason=''):
+        """Planned restart at a safe point; does not count against the circuit breaker."""
+        self.logger.info(f'Recycling browser ({reason})')
+        start = time.monotonic()
+        try:
+            ok = self._restart_and_restore(candidate, search)
+        finally:
+            self.recycle_seconds += time.monotonic() - start
+        self.recycles += 1
+        return ok
+
+    def recover(self, candidate=None, search=None, reason=''):
+        """Restart the browser, log the candidate back in and re-run the current search."""
+        if self.breaker.record_failure():
+            raise DriverUnavailableError(f'Browser died {len(self.breaker.failures)} times within '
+                                         f'{self.breaker.window_seconds}s; giving up')
+
+        self.logger.warning(f'Recovering browser session ({reason or "dead session"})')
+        start = time.monotonic()
+        try:
+            ok = self._restart_and_restore(candidate, search)
+        finally:
+            elapsed = time.monotonic() - start
+            self.recovery_seconds += elapsed
+
+        if ok:
+            self.restarts += 1
+            self.logger.info(f'Browser recovered in {elapsed:.1f}s (restart #{self.restarts})')
+        else:
+            self.failed_restarts += 1
+            self.logger.error(f'Browser recovery failed after {elapsed:.1f}s')
+        return ok
@@ -0,0 +1,69 @@
+import re
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+TERM_SEPARATORS = re.compile(r'[,;|]')
+
+
+def tokenize(text):
+    return [t.rstrip('.') for t in TOKEN_PATTERN.findall(str(text or '').lower())]
+
+
+def split_terms(value):
+    """Split a configured/candidate term list ("ML, AI; Python") into lowercase tokens."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    tokens = []
+    for term in TERM_SEPARATORS.split(str(value)):
+        tokens.extend(tokenize(term))
+    return tokens
+
+
+class RelevanceScorer:
+    """Scores listing titles against search keywords with a single TF-IDF cosine pass."""
+
+    def __init__(self, keywords, threshold=0.1):
+        self.keywords = split_terms(keywords) if isinstance(keywords, str) else [t for k in keywords for t in tokenize(k)]
+        self.threshold = float(threshold)
+
+    def score(self, titles, include=(), exclude=()):
+        """Return one score per title in [0, 1]; titles containing an excluded term score 0."""
+        docs = [tokenize(title) for title in titles]
+        if not docs:
+            return np.zeros(0)
+
+        query = self.keywords + list(include)
+        vocab = {}
+        for tokens in docs + [query, list(exclude)]:
+            for token in tokens:
+                vocab.setdefault(token, len(vocab))
+
+        rows = np.fromiter((i for i, tokens in enumerate(docs) for _ in tokens), dtype=np.intp)
+        cols = np.fromiter((vocab[t] for tokens in docs for t in tokens), dtype=np.intp)
+        tf = np.zeros((len(docs), len(vocab)))
+        np.add.at(tf, (rows, cols), 1.0)
+
+        df = (tf > 0).sum(axis=0)
+        idf = np.log((1 + len(docs)) / (1 + df)) + 1.0
+        weights = tf * idf
+        norms = np.linalg.norm(weights, axis=1)
+        norms[norms == 0] = 1.0
+        weights /= norms[:, None]
+
+        q = np.zeros(len(vocab))
+        for token in query:
+            q[vocab[token]] += 1.0
+        q *= idf
+        q_norm = np.linalg.norm(q)
+        if q_norm == 0:
+            return np.ones(len(docs))
+        scores = weights @ (q / q_norm)
+
+        if exclude:
+            excluded = tf[:, [vocab[t] for t in set(exclude)]].any(axis=1)
+            scores[excluded] = 0.0
+        return scores
+
+    def relevant_mask(self, titles, include=(), exclude=()):
+        return self.score(titles, include, exclude) >= self.threshold
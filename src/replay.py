@@ -0,0 +1,420 @@
+"""Record and replay WebDriver sessions.
+
+``CommandRecorder`` wraps a live driver's command executor and writes every
+WebDriver command, its JSON response and its latency to a JSON-lines file,
+plus page-source snapshots after navigations. ``ReplayDriver`` serves those
+responses back in order with no browser or network, on a virtual clock so
+WebDriverWait timeouts and the bot's random waits resolve instantly but
+deterministically.
+
+    python src/cli.py run --record recordings/session.jsonl
+    python src/cli.py replay recordings/session.jsonl --max-commands 400
+"""
+
+import copy
+import json
+import logging
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from utils import find_call_site
+
+
+RECORDING_VERSION = 1
+SNAPSHOT_COMMANDS = {Command.GET, Command.GO_BACK, Command.CLICK_ELEMENT}
+REDACTED = '***'
+
+
+class ReplayDivergence(WebDriverException):
+    """The bot issued a command the recording does not contain at this point."""
+
+
+def _poll_key(command, params):
+    if not isinstance(params, dict):
+        return command, json.dumps(params)  # params dropped by the recorder's secret check
+    return command, json.dumps({k: v for k, v in params.items() if k != 'sessionId'}, sort_keys=True, default=str)
+
+
+def _recorded_key(entry):
+    if entry['params'] == REDACTED:
+        return entry['command'], None  # params dropped by the recorder's secret check: only the command can be compared
+    return _poll_key(entry['command'], entry['params'])
+
+
+def _same_step(entry, key):
+    recorded = _recorded_key(entry)
+    return recorded == key or (recorded[1] is None and recorded[0] == key[0])
+
+
+def _shorten(text, limit=200):
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _is_click_script(command, params):
+    return command == Command.W3C_EXECUTE_SCRIPT and '.click()' in str((params or {}).get('script', ''))
+
+
+class CommandRecorder:
+    """Command-executor proxy that records a live session to a JSON-lines file."""
+
+    def __init__(self, executor, path, capabilities=None, snapshots=True):
+        self._executor = executor
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.snapshots = snapshots
+        self._secrets = set()
+        self._lock = threading.Lock()
+        self._index = 0
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write({'type': 'header', 'version': RECORDING_VERSION, 'created': datetime.now().isoformat(timespec='seconds'),
+                     'capabilities': capabilities or {}})
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+    def rebind(self, executor):
+        """Keep recording into the same file after the browser is restarted."""
+        self._executor = executor
+        with self._lock:
+            if self._file.closed:
+                self._file = open(self.path, 'a', encoding='utf-8')
+
+    def redact(self, secret):
+        if secret:
+            self._secrets.add(str(secret))
+
+    def _scrub(self, value):
+        text = json.dumps(value, default=str)
+        for secret in self._secrets:
+            text = text.replace(json.dumps(secret)[1:-1], REDACTED)
+        return json.loads(text)
+
+    def _scrub_params(self, params):
+        params = self._scrub(copy.deepcopy(params))
+        # send_keys also carries the text split into characters ('value'), which the string replace cannot see
+        if isinstance(params, dict) and isinstance(params.get('value'), list):
+            typed = ''.join(map(str, params['value']))
+            if REDACTED in str(params.get('text', '')) or any(secret in typed for secret in self._secrets):
+                params['text'], params['value'] = REDACTED, list(REDACTED)
+        return params
+
+    def _leaks(self, line):
+        return any(json.dumps(secret)[1:-1] in line or (len(secret) > 1 and json.dumps(list(secret))[1:-1] in line)
+                   for secret in self._secrets)
+
+    def _write(self, entry):
+        line = json.dumps(entry, default=str)
+        if self._leaks(line):
+            # Last line of defence: never write a secret, joined or split into characters, to disk
+            logging.getLogger(__name__).error(f'Recording step {entry.get("i")} still contained a secret; dropping its params')
+            line = json.dumps({**entry, 'params': REDACTED, 'response': REDACTED}, default=str)
+        self._file.write(line + '\n')
+        self._file.flush()
+
+    def mark_candidate(self, candidate, applied_jobs, searches=()):
+        public = {k: v for k, v in candidate.items() if k != 'Password'}
+        with self._lock:
+            # The search order comes from persisted yield stats that replay does not have, so it is recorded too
+            self._write({'type': 'candidate', 'candidate': self._scrub(public), 'applied_jobs': sorted(applied_jobs),
+                         'searches': self._scrub([list(search) for search in searches])})
+
+    def mark_negative_hit(self, job_id, reason, probe_seconds):
+        """Note a listing skipped on the negative cache's word; replay answers the same lookups from these."""
+        with self._lock:
+            self._write({'type': 'negative_hit', 'job_id': str(job_id), 'reason': reason, 'probe_seconds': probe_seconds})
+
+    def execute(self, command, params):
+        recorded_params = self._scrub_params(params)
+        start = time.perf_counter()
+        try:
+            response = self._executor.execute(command, params)
+            error = None
+        except Exception as e:
+            response, error = None, f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._write({'type': 'command', 'i': self._index, 'command': command, 'params': recorded_params,
+                             'response': self._scrub(response), 'error': error, 'elapsed': round(elapsed, 6),
+                             'site': find_call_site()})
+                self._index += 1
+        if self.snapshots and (command in SNAPSHOT_COMMANDS or _is_click_script(command, params)):
+            self._snapshot(params)
+        return response
+
+    def _snapshot(self, params):
+        try:
+            session = {'sessionId': (params or {}).get('sessionId')}
+            html = self._executor.execute(Command.GET_PAGE_SOURCE, dict(session)).get('value')
+            url = self._executor.execute(Command.GET_CURRENT_URL, dict(session)).get('value')
+        except Exception:
+            return
+        with self._lock:
+            self._write({'type': 'snapshot', 'after': self._index - 1, 'url': url, 'html': html})
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        close = getattr(self._executor, 'close', None)
+        if close:
+            close()
+
+
+class Recording:
+    """A loaded recording: header, command entries, snapshots and candidate markers.
+
+    Negative-cache hits are attached to the candidate marker they follow, as ``negative_hits``.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.header = {}
+        self.commands = []
+        self.snapshots = []
+        self.candidates = []
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                kind = entry.get('type')
+                if kind == 'header': self.header = entry
+                elif kind == 'command': self.commands.append(entry)
+                elif kind == 'snapshot': self.snapshots.append(entry)
+                elif kind == 'candidate': self.candidates.append(entry)
+                elif kind == 'negative_hit' and self.candidates:
+                    self.candidates[-1].setdefault('negative_hits', {})[entry['job_id']] = (entry['reason'], entry['probe_seconds'])
+        if self.header.get('version') != RECORDING_VERSION:
+            raise ValueError(f'Unsupported recording version in {self.path}: {self.header.get("version")}')
+
+
+class VirtualClock:
+    """Drop-in for the ``time`` module: sleeps advance a counter instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += max(seconds, 0)
+        self.now += max(seconds, 0)
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@contextmanager
+def virtual_time(clock, *modules):
+    """Temporarily replace ``module.time`` with ``clock`` for each given module."""
+    saved = [(module, module.time) for module in modules]
+    try:
+        for module, _ in saved:
+            module.time = clock
+        yield clock
+    finally:
+        for module, original in saved:
+            module.time = original
+
+
+class ReplayExecutor:
+    """Serves recorded responses in order and tracks divergences from the recording.
+
+    A step matches when both the command and its parameters (URL, locator,
+    script and arguments, typed text) equal the recorded ones. WebDriverWait may
+    poll a different number of times than it did live; repeated polls of the
+    same command are absorbed in both directions rather than reported as
+    divergences.
+    """
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.clock = VirtualClock()
+        self.position = 0
+        self.last = None
+        self.served = Counter()
+        self.by_site = Counter()
+        self.extra_polls = 0
+        self.skipped_polls = 0
+        self.divergences = []
+
+    def _response(self, entry):
+        self.clock.advance(entry.get('elapsed', 0))
+        self.last = entry
+        if entry.get('error'):
+            raise WebDriverException(f'Recorded failure: {entry["error"]}')
+        return copy.deepcopy(entry['response'])
+
+    def _diverge(self, message):
+        if len(self.divergences) < 20:
+            self.divergences.append(message)
+        raise ReplayDivergence(message)
+
+    def execute(self, command, params):
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': 'replay', 'capabilities': self.recording.header.get('capabilities', {})}}
+
+        commands = self.recording.commands
+        key = _poll_key(command, params)
+        if self.last and _same_step(self.last, key) and (self.position >= len(commands) or not _same_step(commands[self.position], key)):
+            self.extra_polls += 1
+            return self._count(command, self._response(self.last))
+
+        last_key = _recorded_key(self.last) if self.last else None
+        while last_key and not _same_step(self.last, key) and self.position < len(commands) and \
+                _recorded_key(commands[self.position]) == last_key:
+            self.position += 1
+            self.skipped_polls += 1
+
+        if self.position >= len(commands):
+            if command == Command.QUIT:
+                return {'value': None}
+            self._diverge(f'Recording exhausted at step {self.position}: got {command}')
+
+        entry = commands[self.position]
+        if entry['command'] != command:
+            if command == Command.GET_PAGE_SOURCE:
+                return self._count(command, {'value': self._current_snapshot()})
+            if command == Command.QUIT:
+                return {'value': None}
+            self._diverge(f'Step {self.position}: expected {entry["command"]} (from {entry.get("site")}), got {command}')
+        if not _same_step(entry, key):
+            # Same command with a different URL, locator, script or text would otherwise be served the recorded response
+            self._diverge(f'Step {self.position}: {command} (from {entry.get("site")}) expected params '
+                          f'{_shorten(_recorded_key(entry)[1])}, got {_shorten(key[1])}')
+        self.position += 1
+        return self._count(command, self._response(entry))
+
+    def _count(self, command, response):
+        self.served[command] += 1
+        self.by_site[find_call_site()] += 1
+        return response
+
+    def _current_snapshot(self):
+        html = ''
+        for snapshot in self.recording.snapshots:
+            if snapshot['after'] >= self.position:
+                break
+            html = snapshot['html']
+        return html
+
+    def close(self):
+        pass
+
+
+class RecordedNegativeCache:
+    """Stands in for NegativeJobCache in replay: a lookup hits exactly when it did for this candidate live."""
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.added = 0
+        self.seconds_saved = 0.0
+
+    def use(self, marker):
+        self.entries = marker.get('negative_hits', {})
+
+    def lookup(self, job_id):
+        entry = self.entries.get(str(job_id))
+        if entry is None:
+            self.misses += 1
+            return None
+        return tuple(entry)
+
+    def skipped(self, probe_seconds):
+        self.hits += 1
+        self.seconds_saved += probe_seconds
+
+    def add(self, job_id, reason, probe_seconds=0.0):
+        self.added += 1  # later hits on it were recorded with the candidate that had them
+
+    def close(self):
+        pass
+
+
+class ReplayDriver(RemoteWebDriver):
+    """Remote WebDriver whose commands are answered from a recording."""
+
+    def __init__(self, recording):
+        self.replay = ReplayExecutor(recording)
+        super().__init__(command_executor=self.replay, options=ChromeOptions())
+
+
+class _OfflineActivityLogger:
+    def log_activity(self, *args, **kwargs):
+        return True
+
+
+def replay_recording(path, config_path='config/settings.ini'):
+    """Replay every candidate in a recording through the bot; return a stats dict."""
+    import jobbot_multi
+    from selenium.webdriver.support import wait as wait_module
+
+    recording = Recording(path)
+    project_dir = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        (base_dir / 'config').mkdir()
+        (base_dir / 'data').mkdir()
+        shutil.copy(project_dir / config_path, base_dir / config_path)
+        _seed_history(base_dir / 'data' / 'applied_jobs.csv', recording.candidates)
+
+        bot = jobbot_multi.InsightGlobalJobBot(config_path, base_dir=base_dir)
+        bot.activity_logger = _OfflineActivityLogger()
+        # The shared negative cache held entries replay's empty one lacks; answer lookups as they were answered live
+        if bot.negative_cache: bot.negative_cache.close()
+        bot.negative_cache = RecordedNegativeCache()
+        start = time.perf_counter()
+        driver = ReplayDriver(recording)
+        with virtual_time(driver.replay.clock, jobbot_multi, wait_module):
+            bot.attach_driver(driver)
+            for marker in recording.candidates:
+                bot.negative_cache.use(marker)
+                # Same steps as run(), incl. its liveness probe, with the search order the live run used
+                bot.run_candidate(dict(marker['candidate'], Password=REDACTED), marker.get('searches'))
+        wall = time.perf_counter() - start
+        logging.shutdown()
+
+    replay = driver.replay
+    return {
+        'recording': str(recording.path),
+        'commands_recorded': len(recording.commands),
+        'commands_replayed': sum(replay.served.values()),
+        'commands_consumed': replay.position,
+        'extra_polls': replay.extra_polls,
+        'skipped_polls': replay.skipped_polls,
+        'negative_cache_hits': bot.negative_cache.hits,
+        'divergences': replay.divergences,
+        'by_command': dict(replay.served.most_common()),
+        'by_site': dict(replay.by_site.most_common()),
+        'recorded_seconds': round(sum(c.get('elapsed', 0) for c in recording.commands), 3),
+        'virtual_seconds': round(replay.clock.now, 3),
+        'replay_wall_seconds': round(wall, 3),
+    }
+
+
+def _seed_history(applied_file, candidates):
+    import csv
+    with open(applied_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['CandidateEmail', 'JobTitle', 'JobID', 'AppliedDate', 'Status'])
+        for marker in candidates:
+            for job_id in marker.get('applied_jobs', []):
+                writer.writerow([marker['candidate'].get('Email'), '', job_id, '', 'Recorded'])
@@ -0,0 +1,177 @@
+import logging
+
+from recovery import is_dead_session_error
+
+
+JOB_LISTING_XPATH = '//div[@class="job-title"]'
+
+# Shared by the live results page and result pages fetched in the background (parsed with DOMParser)
+LISTING_FUNCTIONS_JS = '''
+function harvestListings(doc, xpath, base) {
+    const nodes = doc.evaluate(xpath, doc, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const listings = [];
+    for (let i = 0; i < nodes.snapshotLength; i++) {
+        const el = nodes.snapshotItem(i);
+        const link = el.querySelector('a');
+        const href = link && link.getAttribute('href');
+        listings.push({
+            title: (el.innerText || el.textContent || '').trim().split('\\n')[0].trim(),
+            href: href ? new URL(href, base).href : null,
+            element_id: el.getAttribute('data-job-id') || el.id || null
+        });
+    }
+    return listings;
+}
+function nextPageUrl(doc, base) {
+    let link = doc.querySelector('link[rel="next"], a[rel="next"], .pagination .next a, li.next > a, a.next, a[aria-label="Next"], a[title^="Next"]');
+    if (!link) link = Array.from(doc.querySelectorAll('a')).find(a => /^(next( page)?|›|»|>)$/i.test((a.textContent || '').trim()));
+    const href = link && link.getAttribute('href');
+    // Postback-style pagination (javascript:__doPostBack) cannot be fetched without navigating
+    if (!href || href === '#' || href.startsWith('javascript:')) return null;
+    return new URL(href, base).href;
+}
+function harvestPage(doc, xpath, base) {
+    return {url: base, listings: harvestListings(doc, xpath, base), next: nextPageUrl(doc, base)};
+}
+function fetchPage(url, xpath) {
+    return fetch(url, {credentials: 'include'})
+        .then(r => r.ok ? r.text() : Promise.reject('HTTP ' + r.status))
+        .then(html => harvestPage(new DOMParser().parseFromString(html, 'text/html'), xpath, url))
+        .catch(e => ({url: url, listings: null, next: null, error: String(e)}));
+}
+function prefetchPage(url, xpath) {
+    // Kept on the window: only survives while this tab is not navigated (tab mode's results tab)
+    window.__jobbotPrefetch = url ? {url: url, page: fetchPage(url, xpath)} : null;
+}
+'''
+
+# arguments: xpath, prefetch (start fetching the next page in the background of this tab)
+HARVEST_PAGE_SCRIPT = LISTING_FUNCTIONS_JS + '''
+const page = harvestPage(document, arguments[0], location.href);
+if (arguments[1]) prefetchPage(page.next, arguments[0]);
+return page;
+'''
+
+# Fetched and parsed in the page context of a tab, without navigating it; a matching prefetch is awaited instead
+FETCH_PAGE_SCRIPT = LISTING_FUNCTIONS_JS + '''
+const [url, xpath, prefetch] = arguments;
+const done = arguments[arguments.length - 1];
+const pending = window.__jobbotPrefetch;
+window.__jobbotPrefetch = null;
+const result = pending && pending.url === url
+    ? pending.page.then(page => page.listings ? Object.assign(page, {prefetched: true}) : fetchPage(url, xpath))
+    : fetchPage(url, xpath);
+result.then(page => {
+    if (prefetch && page.listings) prefetchPage(page.next, xpath);
+    done(page);
+});
+'''
+
+
+def fallback_job_id(page_number, index):
+    """Position-based JobID for a listing without a parsable link or element id."""
+    return f'job_{index}' if page_number == 1 else f'job_{page_number}_{index}'
+
+
+class ResultPages:
+    """Lazy iterator over all search result pages, starting from the page the browser is on.
+
+    Pages are dicts with ``number``, ``url``, ``listings`` and ``next``. The next page
+    is only fetched (in the page context, without navigating) once the consumer
+    asks for it. ``recover(error)`` is called when the browser dies while a page
+    is harvested, fetched or opened; if it restores the session the step is retried.
+
+    With ``prefetch_window`` set to a tab that is never navigated (tab mode's results
+    tab), the page after the one handed out is fetched ahead in that tab. Click and
+    deep-link mode navigate their only tab, which cancels any fetch running in it,
+    so they fetch each page on demand.
+    """
+
+    def __init__(self, bot, xpath=JOB_LISTING_XPATH, max_pages=0, recover=None):
+        self.bot = bot
+        self.xpath = xpath
+        self.max_pages = max_pages
+        self.recover = recover
+        self.prefetch_window = None
+        self.logger = logging.getLogger(__name__)
+
+    def __iter__(self):
+        page = self._call(self._harvest_current)
+        seen = set()
+        while page is not None:
+            seen.add(page['url'])
+            self.bot.run_stats['result_pages'] += 1
+            yield page
+            if not page['next'] or page['next'] in seen or (self.max_pages and page['number'] >= self.max_pages):
+                return
+            page = self._call(self._fetch, page['next'], page['number'] + 1)
+
+    def _call(self, action, *args):
+        # After recovery the browser is logged in again and back on the first results page
+        try:
+            return action(*args)
+        except Exception as e:
+            if not (self.recover and is_dead_session_error(e) and self.recover(e)):
+                raise
+        if self.prefetch_window:
+            self.prefetch_window = self.bot.driver.current_window_handle
+        return action(*args)
+
+    def _prefetches_after(self, number):
+        return bool(self.prefetch_window) and not (self.max_pages and number >= self.max_pages)
+
+    def _prepare(self, page, number):
+        page['number'] = number
+        for idx, listing in enumerate(page['listings']):
+            fallback = listing.get('element_id') or fallback_job_id(number, idx)
+            href_id = self.bot._parse_job_id(listing.get('href'), None)
+            listing['job_id'] = href_id or fallback
+            listing['id_from_href'] = href_id is not None  # only real JobIDs may go into the shared negative cache
+        return page
+
+    def _harvest_current(self):
+        try:
+            # Tab mode harvests from its results tab, so a prefetch started here runs in prefetch_window
+            page = self.bot.driver.execute_script(HARVEST_PAGE_SCRIPT, self.xpath, self._prefetches_after(1)) or {}
+        except Exception as e:
+            if is_dead_session_error(e): raise
+            self.logger.warning(f'Could not harvest job listings: {e}')
+            page = {}
+        page = {'url': page.get('url') or '', 'listings': page.get('listings') or [], 'next': page.get('next')}
+        return self._prepare(page, 1)
+
+    def _fetch(self, url, number):
+        try:
+            page = self._in_window(self.prefetch_window, self.bot.driver.execute_async_script, FETCH_PAGE_SCRIPT,
+                                   url, self.xpath, self._prefetches_after(number)) or {}
+        except Exception as e:
+            if is_dead_session_error(e): raise
+            page = {'error': str(e)}
+        if page.get('listings') is None:
+            self.logger.warning(f'Could not load results page {number} ({url}): {page.get("error")}')
+            return None
+        if page.get('prefetched'):
+            self.bot.run_stats['result_pages_prefetched'] += 1
+        self.logger.info(f'Loaded results page {number}: {len(page["listings"])} listings')
+        return self._prepare(page, number)
+
+    def _in_window(self, handle, action, *args):
+        """Run action with the driver switched to window handle (if given), then switch back."""
+        driver = self.bot.driver
+        current = driver.current_window_handle if handle else None
+        if current == handle:
+            return action(*args)
+        driver.switch_to.window(handle)
+        try:
+            return action(*args)
+        finally:
+            driver.switch_to.window(current)
+
+    def open(self, page):
+        """Navigate to a page fetched in the background; the first page is already loaded by the search."""
+        if page['number'] > 1:
+            self._call(self._navigate, page['url'])
+
+    def _navigate(self, url):
+        if self.bot.driver.current_url != url:
+            self.bot.driver.get(url)
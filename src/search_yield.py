@@ -0,0 +1,109 @@
+import logging
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class SearchYieldTracker:
+    """Per candidate × keyword × location yield history and a UCB1 ordering of the searches.
+
+    Each search visit records new applications, minutes spent, listings seen and
+    how many were already applied to. Older visits are decayed so searches that
+    dry up lose their rank. Stats are kept per candidate because how much of a
+    search is already applied to depends on the candidate's history. Backed by
+    SQLite so shard workers (and later runs) share them.
+    """
+
+    def __init__(self, path, exploration=0.5, decay=0.8):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.exploration = exploration
+        self.decay = decay
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS candidate_search_yield (
+            candidate TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            location TEXT NOT NULL,
+            visits REAL NOT NULL DEFAULT 0,
+            applications REAL NOT NULL DEFAULT 0,
+            minutes REAL NOT NULL DEFAULT 0,
+            listings REAL NOT NULL DEFAULT 0,
+            already_applied REAL NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (candidate, keyword, location))''')
+
+    @staticmethod
+    def _key(search):
+        return search[0].strip().lower(), search[1].strip().lower()
+
+    def stats(self, candidate, searches):
+        with self._lock:
+            rows = self._conn.execute('SELECT keyword, location, visits, applications, minutes, listings, already_applied '
+                                      'FROM candidate_search_yield WHERE candidate = ?', (candidate.strip().lower(),)).fetchall()
+        known = {(r[0], r[1]): dict(zip(('visits', 'applications', 'minutes', 'listings', 'already_applied'), r[2:])) for r in rows}
+        return {search: known.get(self._key(search)) for search in searches}
+
+    @staticmethod
+    def rate(stat):
+        """New applications per minute."""
+        return stat['applications'] / stat['minutes'] if stat and stat['minutes'] > 0 else 0.0
+
+    def order(self, candidate, searches):
+        """The candidate's searches by UCB1 score on applications per minute; never-tried ones first, in configured order."""
+        stats = self.stats(candidate, searches)
+        total_visits = sum(s['visits'] for s in stats.values() if s)
+
+        def score(search):
+            stat = stats[search]
+            if not stat or stat['visits'] < 1e-3:
+                return math.inf
+            bonus = self.exploration * math.sqrt(math.log(max(total_visits, 1.0) + 1) / stat['visits'])
+            return self.rate(stat) + bonus
+
+        return sorted(searches, key=score, reverse=True)  # stable: ties keep settings.ini order
+
+    def estimate(self, candidate, searches, quota):
+        """Model estimate of (applications, minutes) to fill ``quota`` visiting ``searches`` in this order."""
+        stats = self.stats(candidate, searches)
+        known = [s for s in stats.values() if s and s['visits'] > 0]
+        prior = ({k: sum(s[k] for s in known) / sum(s['visits'] for s in known) for k in ('applications', 'minutes')}
+                 if known else {'applications': 0.0, 'minutes': 0.0})
+        applications = minutes = 0.0
+        for search in searches:
+            stat = stats[search]
+            per_visit = {k: stat[k] / stat['visits'] for k in ('applications', 'minutes')} if stat and stat['visits'] > 0 else prior
+            remaining = quota - applications
+            if remaining <= 0:
+                break
+            if per_visit['applications'] > remaining:
+                minutes += per_visit['minutes'] * remaining / per_visit['applications']
+                applications = quota
+                break
+            applications += per_visit['applications']
+            minutes += per_visit['minutes']
+        return applications, minutes
+
+    def record(self, candidate, search, applications, seconds, listings=0, already_applied=0):
+        keyword, location = self._key(search)
+        with self._lock:
+            self._conn.execute('''INSERT INTO candidate_search_yield (candidate, keyword, location, visits, applications, minutes,
+                    listings, already_applied, updated_at)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT (candidate, keyword, location) DO UPDATE SET
+                    visits = visits * ? + 1, applications = applications * ? + excluded.applications,
+                    minutes = minutes * ? + excluded.minutes, listings = listings * ? + excluded.listings,
+                    already_applied = already_applied * ? + excluded.already_applied, updated_at = excluded.updated_at''',
+                               (candidate.strip().lower(), keyword, location, applications, seconds / 60, listings, already_applied, time.time(),
+                                *([self.decay] * 5)))
+        ratio = already_applied / listings if listings else 0.0
+        self.logger.info(f'Search yield {search[0]} in {search[1]} for {candidate}: {applications} new in {seconds / 60:.1f} min, '
+                         f'{ratio:.0%} of {listings} listings already applied')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,264 @@
+import configparser
+import logging
+import threading
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+
+class SettingsError(ValueError):
+    """Raised when settings.ini contains a missing or invalid value."""
+
+
+def _csv_tuple(value):
+    return tuple(part.strip() for part in str(value).split(',') if part.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable, typed snapshot of settings.ini. Hot paths read attributes directly."""
+
+    keywords: tuple = ()
+    locations: tuple = ()
+    max_applications_per_candidate: int = 10
+    max_result_pages: int = 10
+
+    headless: bool = False
+    random_delay_min: float = 2.0
+    random_delay_max: float = 5.0
+    implicit_wait: int = 10
+    explicit_wait: int = 30
+    settings_poll_seconds: float = 2.0
+    tab_pipelining: bool = False
+    deep_link_apply: bool = False
+    apply_url_template: str = ''
+    scripted_form_fill: bool = True
+    native_key_fields: tuple = ()
+
+    csv_logging_enabled: bool = True
+    csv_log_file: str = 'logs/jobbot_logs.csv'
+    log_level: str = 'INFO'
+
+    relevance_enabled: bool = True
+    relevance_keywords: tuple = ()
+    relevance_threshold: float = 0.1
+
+    recovery_max_restarts: int = 3
+    recovery_window_seconds: float = 900.0
+
+    watchdog_enabled: bool = True
+    watchdog_max_rss_mb: int = 2048
+    watchdog_recycle_after_applications: int = 0
+    watchdog_sample_seconds: float = 30.0
+    watchdog_log_file: str = 'logs/memory_usage.csv'
+
+    negative_cache_enabled: bool = True
+    negative_cache_ttl_hours: float = 24.0
+    negative_cache_file: str = 'data/negative_jobs.sqlite3'
+
+    search_order_adaptive: bool = True
+    search_order_exploration: float = 0.5
+    search_order_decay: float = 0.8
+    search_order_file: str = 'data/search_yield.sqlite3'
+
+    metrics_enabled: bool = True
+    metrics_top_offenders: int = 10
+
+    events_enabled: bool = True
+    events_file: str = 'logs/events.jsonl'
+    events_max_mb: float = 10.0
+    events_backup_count: int = 5
+
+    def validate(self):
+        if not self.keywords:
+            raise SettingsError('[search] keywords must not be empty')
+        if self.max_applications_per_candidate < 0:
+            raise SettingsError('[search] max_applications_per_candidate must be >= 0')
+        if self.max_result_pages < 0:
+            raise SettingsError('[search] max_result_pages must be >= 0')
+        if not 0 <= self.random_delay_min <= self.random_delay_max:
+            raise SettingsError('[bot] random_delay_min must be between 0 and random_delay_max')
+        if self.implicit_wait < 0 or self.explicit_wait <= 0:
+            raise SettingsError('[bot] implicit_wait must be >= 0 and explicit_wait > 0')
+        if self.settings_poll_seconds < 0:
+            raise SettingsError('[bot] settings_poll_seconds must be >= 0')
+        if self.apply_url_template and '{job_id}' not in self.apply_url_template:
+            raise SettingsError('[bot] apply_url_template must contain {job_id}')
+        if set(self.native_key_fields) - {'linkedin', 'phone'}:
+            raise SettingsError('[bot] native_key_fields may only contain linkedin, phone')
+        if self.log_level.upper() not in logging.getLevelNamesMapping():
+            raise SettingsError(f'[logging] unknown log_level {self.log_level!r}')
+        if not 0 <= self.relevance_threshold <= 1:
+            raise SettingsError('[relevance] threshold must be between 0 and 1')
+        if self.recovery_max_restarts < 0 or self.recovery_window_seconds <= 0:
+            raise SettingsError('[recovery] max_restarts must be >= 0 and window_seconds > 0')
+        if self.watchdog_max_rss_mb < 0 or self.watchdog_recycle_after_applications < 0 or self.watchdog_sample_seconds < 0:
+            raise SettingsError('[watchdog] max_rss_mb, recycle_after_applications and sample_seconds must be >= 0')
+        if self.negative_cache_ttl_hours <= 0:
+            raise SettingsError('[negative_cache] ttl_hours must be > 0')
+        if self.search_order_exploration < 0 or not 0 < self.search_order_decay <= 1:
+            raise SettingsError('[search_order] exploration must be >= 0 and decay in (0, 1]')
+        if self.metrics_top_offenders < 1:
+            raise SettingsError('[metrics] top_offenders must be >= 1')
+        if self.events_max_mb <= 0 or self.events_backup_count < 1:
+            raise SettingsError('[events] max_mb must be > 0 and backup_count >= 1')
+        return self
+
+    def diff(self, other):
+        return {f.name: (getattr(self, f.name), getattr(other, f.name))
+                for f in fields(self) if getattr(self, f.name) != getattr(other, f.name)}
+
+
+# (section, option, Settings field, value kind)
+SETTINGS_SCHEMA = [
+    ('search', 'keywords', 'keywords', 'tuple'),
+    ('search', 'location', 'locations', 'tuple'),
+    ('search', 'max_applications_per_candidate', 'max_applications_per_candidate', 'int'),
+    ('search', 'max_result_pages', 'max_result_pages', 'int'),
+    ('bot', 'headless', 'headless', 'bool'),
+    ('bot', 'random_delay_min', 'random_delay_min', 'float'),
+    ('bot', 'random_delay_max', 'random_delay_max', 'float'),
+    ('bot', 'implicit_wait', 'implicit_wait', 'int'),
+    ('bot', 'explicit_wait', 'explicit_wait', 'int'),
+    ('bot', 'settings_poll_seconds', 'settings_poll_seconds', 'float'),
+    ('bot', 'tab_pipelining', 'tab_pipelining', 'bool'),
+    ('bot', 'deep_link_apply', 'deep_link_apply', 'bool'),
+    ('bot', 'apply_url_template', 'apply_url_template', 'str'),
+    ('bot', 'scripted_form_fill', 'scripted_form_fill', 'bool'),
+    ('bot', 'native_key_fields', 'native_key_fields', 'tuple'),
+    ('logging', 'csv_logging_enabled', 'csv_logging_enabled', 'bool'),
+    ('logging', 'csv_log_file', 'csv_log_file', 'str'),
+    ('logging', 'log_level', 'log_level', 'str'),
+    ('relevance', 'enabled', 'relevance_enabled', 'bool'),
+    ('relevance', 'keywords', 'relevance_keywords', 'tuple'),
+    ('relevance', 'threshold', 'relevance_threshold', 'float'),
+    ('recovery', 'max_restarts', 'recovery_max_restarts', 'int'),
+    ('recovery', 'window_seconds', 'recovery_window_seconds', 'float'),
+    ('watchdog', 'enabled', 'watchdog_enabled', 'bool'),
+    ('watchdog', 'max_rss_mb', 'watchdog_max_rss_mb', 'int'),
+    ('watchdog', 'recycle_after_applications', 'watchdog_recycle_after_applications', 'int'),
+    ('watchdog', 'sample_seconds', 'watchdog_sample_seconds', 'float'),
+    ('watchdog', 'log_file', 'watchdog_log_file', 'str'),
+    ('negative_cache', 'enabled', 'negative_cache_enabled', 'bool'),
+    ('negative_cache', 'ttl_hours', 'negative_cache_ttl_hours', 'float'),
+    ('negative_cache', 'file', 'negative_cache_file', 'str'),
+    ('search_order', 'adaptive', 'search_order_adaptive', 'bool'),
+    ('search_order', 'exploration', 'search_order_exploration', 'float'),
+    ('search_order', 'decay', 'search_order_decay', 'float'),
+    ('search_order', 'file', 'search_order_file', 'str'),
+    ('metrics', 'enabled', 'metrics_enabled', 'bool'),
+    ('metrics', 'top_offenders', 'metrics_top_offenders', 'int'),
+    ('events', 'enabled', 'events_enabled', 'bool'),
+    ('events', 'file', 'events_file', 'str'),
+    ('events', 'max_mb', 'events_max_mb', 'float'),
+    ('events', 'backup_count', 'events_backup_count', 'int'),
+]
+
+
+# Only read when the bot starts (components are built once); a reload cannot apply them mid-run
+RESTART_FIELDS = frozenset({
+    'csv_logging_enabled', 'csv_log_file', 'watchdog_enabled', 'watchdog_sample_seconds', 'watchdog_log_file',
+    'negative_cache_enabled', 'negative_cache_file', 'search_order_adaptive', 'search_order_file', 'metrics_enabled',
+    'events_enabled', 'events_file', 'events_max_mb', 'events_backup_count',
+})
+# Only read when a browser is started, so they apply from the next recovery or recycle on
+BROWSER_FIELDS = frozenset({'headless', 'implicit_wait'})
+
+
+def load_settings(path):
+    """Parse and validate settings.ini into a Settings snapshot."""
+    parser = configparser.ConfigParser()
+    if not parser.read(path):
+        raise SettingsError(f'Settings file not found: {path}')
+
+    defaults = Settings()
+    values = {}
+    for section, option, field, kind in SETTINGS_SCHEMA:
+        if not parser.has_option(section, option):
+            continue
+        try:
+            if kind == 'bool': values[field] = parser.getboolean(section, option)
+            elif kind == 'int': values[field] = parser.getint(section, option)
+            elif kind == 'float': values[field] = parser.getfloat(section, option)
+            elif kind == 'tuple': values[field] = _csv_tuple(parser.get(section, option))
+            else: values[field] = parser.get(section, option).strip()
+        except ValueError as e:
+            raise SettingsError(f'[{section}] {option}: {e}') from e
+    return replace(defaults, **values).validate()
+
+
+class SettingsWatcher:
+    """Polls settings.ini and atomically swaps in a new Settings snapshot when it changes.
+
+    Readers only dereference ``current`` (a single attribute read), so there is no
+    lock on the hot path; a broken edit is logged and the previous snapshot kept.
+    """
+
+    def __init__(self, path, on_change=None):
+        self.path = Path(path)
+        self.on_change = on_change
+        self.logger = logging.getLogger(__name__)
+        self._signature = self._stat()
+        self.current = load_settings(self.path)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _stat(self):
+        try:
+            st = self.path.stat()
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def check(self):
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            new = load_settings(self.path)
+        except SettingsError as e:
+            self.logger.error(f'Ignoring invalid settings change: {e}')
+            return False
+
+        old, self.current = self.current, new
+        changes = old.diff(new)
+        if changes:
+            self._log_changes(changes)
+            if self.on_change:
+                self.on_change(old, new)
+        return True
+
+    def _log_changes(self, changes):
+        def listed(names):
+            return ', '.join(f'{k}={changes[k][1]!r}' for k in names)
+
+        live = [k for k in changes if k not in RESTART_FIELDS | BROWSER_FIELDS]
+        browser = [k for k in changes if k in BROWSER_FIELDS]
+        restart = [k for k in changes if k in RESTART_FIELDS]
+        if live:
+            self.logger.info(f'Settings reloaded: {listed(live)}')
+        if browser:
+            self.logger.info(f'Settings take effect when the browser is next started: {listed(browser)}')
+        if restart:
+            self.logger.warning(f'Settings changed but not applied until the bot is restarted: {listed(restart)}')
+
+    def start(self):
+        interval = self.current.settings_poll_seconds
+        if interval <= 0 or self._thread:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name='settings-watcher', daemon=True)
+        self._thread.start()
+
+    def _poll(self):
+        while not self._stop.wait(self.current.settings_poll_seconds or 1.0):
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error(f'Settings watcher error: {e}')
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,189 @@
+"""Local HTTP/JSON stats service over data/applied_jobs.csv.
+
+Aggregates are kept in memory and updated by tailing the history file, so
+operators and scripts can poll during a run without re-reading the CSV:
+
+    python src/cli.py stats-server --port 8765
+    curl localhost:8765/totals
+    curl localhost:8765/by-candidate
+    curl localhost:8765/by-status
+    curl "localhost:8765/by-date?days=7"
+    curl "localhost:8765/recent?limit=20"
+"""
+
+import csv
+import json
+import logging
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+
+class ApplicationStats:
+    """In-memory aggregates of the application history, updated incrementally as rows are appended."""
+
+    def __init__(self, path, recent_limit=200):
+        self.path = Path(path)
+        self.recent_limit = recent_limit
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.total = 0
+        self.by_candidate = Counter()
+        self.by_status = Counter()
+        self.by_date = Counter()
+        self.by_candidate_status = {}
+        self.last_applied = {}
+        self.recent = deque(maxlen=self.recent_limit)
+        self.columns = None
+        self.updated_at = None
+        self._offset = 0
+        self._tail = b''  # last consumed line, used to detect rewrites of already-read rows
+
+    def refresh(self):
+        """Fold rows appended since the last call into the aggregates; reload if the file was rewritten."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            with self._lock:
+                self._reset()
+            return 0
+
+        with open(self.path, 'rb') as f:
+            if size < self._offset or not self._unchanged(f):
+                with self._lock:
+                    self._reset()
+            f.seek(self._offset)
+            chunk = f.read()
+
+        end = chunk.rfind(b'\n') + 1  # leave a partially written last line for the next refresh
+        if end == 0:
+            return 0
+        consumed = chunk[:end]
+        lines = consumed.decode('utf-8-sig' if self._offset == 0 else 'utf-8', errors='replace').splitlines()
+        added = 0
+        with self._lock:
+            for row in csv.reader(lines):
+                if not row:
+                    continue
+                if self.columns is None:
+                    self.columns = row
+                    continue
+                self._add(dict(zip(self.columns, row)))
+                added += 1
+            self._offset += end
+            self._tail = consumed[consumed.rfind(b'\n', 0, end - 1) + 1:]
+            self.updated_at = datetime.now().isoformat(timespec='seconds')
+        return added
+
+    def _unchanged(self, f):
+        if not self._tail:
+            return True
+        f.seek(self._offset - len(self._tail))
+        return f.read(len(self._tail)) == self._tail
+
+    def _add(self, record):
+        email = record.get('CandidateEmail') or 'Unknown'
+        status = record.get('Status') or 'Unknown'
+        applied = record.get('AppliedDate') or ''
+        self.total += 1
+        self.by_candidate[email] += 1
+        self.by_status[status] += 1
+        self.by_candidate_status.setdefault(email, Counter())[status] += 1
+        if applied:
+            self.by_date[applied[:10]] += 1
+            self.last_applied[email] = max(self.last_applied.get(email, ''), applied)
+        self.recent.append(record)
+
+    def totals(self):
+        with self._lock:
+            return {'total_applications': self.total, 'candidates': len(self.by_candidate),
+                    'applied': self.by_status.get('Applied', 0), 'by_status': dict(self.by_status),
+                    'last_application': max(self.last_applied.values(), default=None), 'updated_at': self.updated_at}
+
+    def candidates(self):
+        with self._lock:
+            return {email: {'total': count, 'by_status': dict(self.by_candidate_status[email]),
+                            'last_application': self.last_applied.get(email)}
+                    for email, count in self.by_candidate.most_common()}
+
+    def statuses(self):
+        with self._lock:
+            return dict(self.by_status.most_common())
+
+    def dates(self, days=None):
+        with self._lock:
+            dates = sorted(self.by_date.items())
+        return dict(dates[-days:] if days else dates)
+
+    def recent_applications(self, limit=20):
+        with self._lock:
+            return list(self.recent)[-limit:][::-1]
+
+
+class StatsRequestHandler(BaseHTTPRequestHandler):
+    stats = None  # set by serve()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        def int_arg(name, default=None):
+            try:
+                return int(query[name][0])
+            except (KeyError, ValueError):
+                return default
+
+        routes = {
+            '/totals': lambda: self.stats.totals(),
+            '/by-candidate': lambda: self.stats.candidates(),
+            '/by-status': lambda: self.stats.statuses(),
+            '/by-date': lambda: self.stats.dates(int_arg('days')),
+            '/recent': lambda: self.stats.recent_applications(int_arg('limit', 20)),
+            '/health': lambda: {'status': 'ok', 'updated_at': self.stats.updated_at},
+        }
+        route = routes.get(url.path.rstrip('/') or '/totals')
+        if route is None:
+            self._send(404, {'error': f'Unknown endpoint {url.path}', 'endpoints': sorted(routes)})
+        else:
+            self._send(200, route())
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, indent=2, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format % args)
+
+
+def serve(applied_jobs_csv='data/applied_jobs.csv', host='127.0.0.1', port=8765, interval=2.0):
+    stats = ApplicationStats(applied_jobs_csv)
+    stats.refresh()
+    stop = threading.Event()
+
+    def follow():
+        while not stop.wait(interval):
+            try:
+                stats.refresh()
+            except Exception as e:
+                logging.getLogger(__name__).error(f'Stats refresh failed: {e}')
+
+    handler = type('Handler', (StatsRequestHandler,), {'stats': stats})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=follow, name='stats-follow', daemon=True).start()
+    print(f'Stats service on http://{host}:{port} ({stats.total} applications loaded from {applied_jobs_csv})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
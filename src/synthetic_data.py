@@ -0,0 +1,95 @@
+"""Synthetic candidates.csv / applied_jobs.csv datasets for scale testing.
+
+    python src/cli.py synth --output-dir /tmp/jobbot_1m --rows 1000000 --candidates 2000
+"""
+
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from history import APPLIED_JOBS_COLUMNS
+
+
+CANDIDATE_COLUMNS = ['Email', 'Password', 'FirstName', 'LastName', 'Phone', 'ResumePath', 'Status', 'LinkedInUrl']
+STATUSES = ('Applied', 'No Apply Button', 'Form Error', 'Closed Posting')
+STATUS_WEIGHTS = (0.72, 0.14, 0.09, 0.05)
+SENIORITY = ('', 'Senior ', 'Lead ', 'Staff ', 'Principal ', 'Junior ')
+ROLES = ('ML Engineer', 'AI Engineer', 'Data Scientist', 'Machine Learning Engineer', 'MLOps Engineer',
+         'Data Engineer', 'Software Engineer', 'Python Developer', 'Research Scientist', 'NLP Engineer',
+         'Computer Vision Engineer', 'Analytics Engineer', 'Backend Engineer', 'Platform Engineer')
+FIRST_NAMES = ('Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn', 'Priya', 'Wei', 'Diego', 'Fatima')
+LAST_NAMES = ('Smith', 'Patel', 'Nguyen', 'Garcia', 'Kim', 'Johnson', 'Chen', 'Lopez', 'Brown', 'Singh', 'Müller', 'Okafor')
+CHUNK_ROWS = 500_000
+
+
+def candidate_email(i):
+    return f'candidate{i:06d}@example.com'
+
+
+def generate_candidates(path, count, inactive_ratio=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CANDIDATE_COLUMNS)
+        for i in range(count):
+            first, last = FIRST_NAMES[i % len(FIRST_NAMES)], LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+            writer.writerow([candidate_email(i), f'pw{i:06d}', first, last, f'555{rng.integers(1_000_000, 9_999_999)}',
+                             f'resumes/{first.lower()}_{last.lower()}_{i}.pdf',
+                             'Inactive' if rng.random() < inactive_ratio else 'Active', f'https://linkedin.com/in/candidate{i}'])
+    return path
+
+
+def generate_applied_jobs(path, rows, candidates, jobs=None, days=365, skew=0.8, seed=0, end=None):
+    """Write ``rows`` history rows in AppliedDate order, as the bot appends them.
+
+    Candidate activity follows a Zipf-like distribution (``skew``), JobIDs are drawn
+    from a pool of ``jobs`` postings shared between candidates, and the status mix
+    matches a typical run.
+    """
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or max(rows // 20, 1000)
+    end = end or datetime.now().replace(microsecond=0)
+    start = end - timedelta(days=days)
+    span = int((end - start).total_seconds())
+
+    weights = 1.0 / np.arange(1, candidates + 1) ** skew
+    weights /= weights.sum()
+    emails = np.array([candidate_email(i) for i in range(candidates)], dtype=object)
+    titles = np.array([f'{level}{role}' for role in ROLES for level in SENIORITY], dtype=object)
+    job_titles = titles[rng.integers(0, len(titles), jobs)]
+    job_ids = 100_000 + np.arange(jobs)
+
+    written = 0
+    while written < rows:
+        n = min(CHUNK_ROWS, rows - written)
+        # Each chunk covers its share of the date range so the whole file stays sorted by AppliedDate
+        lo, hi = span * written // rows, span * (written + n) // rows
+        offsets = np.sort(rng.integers(lo, max(hi, lo + 1), n))
+        job = rng.integers(0, jobs, n)
+        chunk = pd.DataFrame({
+            'CandidateEmail': emails[rng.choice(candidates, n, p=weights)],
+            'JobTitle': job_titles[job],
+            'JobID': job_ids[job],
+            'AppliedDate': (pd.Timestamp(start) + pd.to_timedelta(offsets, unit='s')).strftime('%Y-%m-%d %H:%M:%S'),
+            'Status': np.array(STATUSES, dtype=object)[rng.choice(len(STATUSES), n, p=STATUS_WEIGHTS)],
+        }, columns=APPLIED_JOBS_COLUMNS)
+        chunk.to_csv(path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += n
+    if rows == 0:
+        pd.DataFrame(columns=APPLIED_JOBS_COLUMNS).to_csv(path, index=False)
+    return path
+
+
+def generate_dataset(base_dir, rows, candidates, jobs=None, days=365, seed=0):
+    """Create data/candidates.csv and data/applied_jobs.csv under base_dir."""
+    data_dir = Path(base_dir) / 'data'
+    generate_candidates(data_dir / 'candidates.csv', candidates, seed=seed)
+    generate_applied_jobs(data_dir / 'applied_jobs.csv', rows, candidates, jobs, days, seed=seed)
+    return data_dir
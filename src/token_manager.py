@@ -0,0 +1,170 @@
+import base64
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+
+# Refresh this long before the token's exp claim so in-flight calls never carry an expired token
+REFRESH_MARGIN_SECONDS = 300
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE = BASE_DIR / 'data' / '.wbl_token.json'
+
+
+def token_expiry(token):
+    """Return the JWT ``exp`` claim as a Unix timestamp, or None for opaque/undecodable tokens."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def default_store_path():
+    """WBL_TOKEN_FILE or data/.wbl_token.json, relative paths resolved against the project root (not the cwd)."""
+    path = Path(os.getenv('WBL_TOKEN_FILE') or DEFAULT_STORE)
+    return path if path.is_absolute() else BASE_DIR / path
+
+
+def restrict_to_owner(path):
+    """Owner-only access. os.chmod cannot do that on Windows (it only toggles read-only), so replace the
+    inherited ACL with a single full-control grant for the current user there."""
+    if os.name != 'nt':
+        os.chmod(path, 0o600)
+        return
+    user = os.getenv('USERNAME')
+    result = subprocess.run(['icacls', str(path), '/inheritance:r', '/grant:r', f'{user}:F'], capture_output=True, text=True) \
+        if user else None
+    if not result or result.returncode != 0:
+        logging.getLogger(__name__).warning(f'Could not restrict access to {path}; it is readable by anyone who can read its folder')
+
+
+class TokenStore:
+    """JSON file holding the cached API token; writes are atomic (temp file + rename) and owner-only."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f'.{self.path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            restrict_to_owner(tmp)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+class TokenManager:
+    """Process-wide holder of the WBL API token.
+
+    ``get_token`` returns a token that is valid for at least REFRESH_MARGIN_SECONDS,
+    logging in again beforehand when needed. Concurrent callers share one refresh.
+    """
+
+    def __init__(self, api_url, email, password, store_path=DEFAULT_STORE, seed_token='', margin=REFRESH_MARGIN_SECONDS):
+        self.logger = logging.getLogger(__name__)
+        self.api_url = api_url
+        self.credentials = (email, password)
+        self.store = TokenStore(store_path)
+        self.margin = margin
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self.token = ''
+        self.expires_at = None
+        cached = self.store.load()
+        if cached.get('api_url') == api_url and cached.get('email') == email:
+            self._set(cached.get('token', ''))
+        if seed_token and not self._fresh():
+            self._set(seed_token)
+
+    @property
+    def login_url(self):
+        return f'{self.api_url}/login' if 'localhost' not in self.api_url else self.api_url.replace('/api', '/api/login')
+
+    def _set(self, token):
+        self.token = token or ''
+        self.expires_at = token_expiry(self.token) if self.token else None
+
+    def _fresh(self):
+        if not self.token:
+            return False
+        return self.expires_at is None or self.expires_at - time.time() > self.margin
+
+    def get_token(self):
+        if self._fresh():
+            return self.token
+        with self._lock:
+            if not self._fresh():  # another thread may have refreshed while we waited
+                self._refresh()
+            return self.token
+
+    def invalidate(self, token):
+        """Drop a token the server rejected, unless it has already been replaced."""
+        with self._lock:
+            if self.token == token:
+                self._set('')
+
+    def _refresh(self):
+        # Another worker process (run --shard) may already have logged in
+        cached = self.store.load()
+        if cached.get('api_url') == self.api_url and cached.get('email') == self.credentials[0] and cached.get('token') != self.token:
+            previous = self.token
+            self._set(cached.get('token', ''))
+            if self._fresh():
+                return
+            self._set(previous)
+
+        if not all(self.credentials):
+            self._set('')
+            return
+        try:
+            response = requests.post(self.login_url, data={"username": self.credentials[0], "password": self.credentials[1]},
+                                     headers={"Content-Type": "application/x-www-form-urlencoded"}, timeout=30)
+            response.raise_for_status()
+            token = response.json().get("access_token")
+        except Exception as e:
+            self.logger.error(f"Auto-login failed: {e}")
+            return
+        if not token:
+            self.logger.error("Auto-login failed: no access_token in response")
+            return
+
+        self._set(token)
+        self.refreshes += 1
+        try:
+            self.store.save({'api_url': self.api_url, 'email': self.credentials[0], 'token': token, 'expires_at': self.expires_at})
+        except OSError as e:
+            self.logger.warning(f"Could not cache API token in {self.store.path}: {e}")
+        if self.expires_at:
+            self.logger.info(f"API token refreshed, valid for {(self.expires_at - time.time()) / 60:.0f} more minutes")
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_token_manager(api_url, email, password, seed_token=''):
+    """Shared TokenManager per (api_url, email), so every logger in the process reuses one token."""
+    with _managers_lock:
+        key = (api_url, email)
+        if key not in _managers:
+            _managers[key] = TokenManager(api_url, email, password, default_store_path(), seed_token)
+        return _managers[key]
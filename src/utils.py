@@ -2,7 +2,9 @@
 import csv
 import json
 import logging
+import sys
 import threading
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
@@ -67,11 +69,21 @@ def setup_csv_logging(csv_file_path='logs/jobbot_logs.csv', level=logging.INFO):
     return csv_handler
 
 
+def find_call_site(module_file='jobbot_multi.py', default='other'):
+    """Name of the innermost bot method on the current stack (e.g. 'login', '_find_element')."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename.endswith(module_file):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return default
+
+
 def create_candidates_template(output_path='data/candidates_template.csv'):
-    headers = ['Email', 'Password', 'FirstName', 'LastName', 'Phone', 'ResumePath', 'Status']
+    headers = ['Email', 'Password', 'FirstName', 'LastName', 'Phone', 'ResumePath', 'Status', 'IncludeKeywords', 'ExcludeKeywords']
     sample_data = [
-        ['candidate1@example.com', 'password123', 'John', 'Doe', '1234567890', 'resumes/john_doe_resume.pdf', 'Active'],
-        ['candidate2@example.com', 'password456', 'Jane', 'Smith', '0987654321', 'resumes/jane_smith_resume.pdf', 'Active']
+        ['candidate1@example.com', 'password123', 'John', 'Doe', '1234567890', 'resumes/john_doe_resume.pdf', 'Active', 'Python; MLOps', 'Senior; Manager'],
+        ['candidate2@example.com', 'password456', 'Jane', 'Smith', '0987654321', 'resumes/jane_smith_resume.pdf', 'Active', '', '']
     ]
     
     with open(output_path, 'w', newline='') as f:
@@ -84,16 +96,18 @@ def create_candidates_template(output_path='data/candidates_template.csv'):
 
 def generate_report(applied_jobs_csv='data/applied_jobs.csv', output_path='logs/report.json'):
     try:
-        import pandas as pd
+        from history import DATE_FORMAT, load_history
         
-        df = pd.read_csv(applied_jobs_csv)
+        df = load_history(applied_jobs_csv)
+        recent = df.tail(10).astype(object)
+        recent['AppliedDate'] = df['AppliedDate'].tail(10).dt.strftime(DATE_FORMAT)
         
         report = {
             'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'total_applications': len(df),
-            'by_candidate': df.groupby('CandidateEmail').size().to_dict(),
-            'by_status': df.groupby('Status').size().to_dict(),
-            'recent_applications': df.tail(10).to_dict('records')
+            'by_candidate': df.groupby('CandidateEmail', observed=True).size().to_dict(),
+            'by_status': df.groupby('Status', observed=True).size().to_dict(),
+            'recent_applications': recent.to_dict('records')
         }
         
         with open(output_path, 'w') as f:
@@ -107,6 +121,35 @@ def generate_report(applied_jobs_csv='data/applied_jobs.csv', output_path='logs/
         print(f'Error generating report: {e}')
 
 
+def summarize_applications(applied_jobs_csv='data/applied_jobs.csv', top=10):
+    """Print application totals by streaming the history CSV (no pandas needed)."""
+    path = Path(applied_jobs_csv)
+    if not path.exists():
+        print('No applications yet!')
+        return None
+
+    total = 0
+    by_status = Counter()
+    by_candidate = Counter()
+    last_applied = ''
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            total += 1
+            by_status[row.get('Status') or 'Unknown'] += 1
+            by_candidate[row.get('CandidateEmail') or 'Unknown'] += 1
+            last_applied = max(last_applied, row.get('AppliedDate') or '')
+
+    print(f'Total applications: {total}')
+    print(f'Last application: {last_applied or "-"}')
+    print('By status:')
+    for status, count in by_status.most_common():
+        print(f'  {status}: {count}')
+    print(f'Top {top} candidates:')
+    for email, count in by_candidate.most_common(top):
+        print(f'  {email}: {count}')
+    return {'total_applications': total, 'by_status': dict(by_status), 'by_candidate': dict(by_candidate)}
+
+
 if __name__ == '__main__':
     # Create template when run directly
     create_candidates_template()